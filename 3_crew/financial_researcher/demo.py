@@ -6,34 +6,36 @@ This script demonstrates how to use the enhanced financial research crew
 
 import os
 import sys
-from src.financial_researcher.crew import ResearchCrew
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 def demo_financial_research():
     """
     Demonstrate the financial research assistant capabilities
     """
-    print("🔬 Financial Research Assistant Demo")
-    print("=" * 50)
+    # Imported here so that 'test-tools' does not pay for loading crewai's agent stack
+    from src.financial_researcher.crew import REPORT_PATH, ResearchCrew
     
     # Example companies to analyze
     demo_companies = ['Apple', 'Tesla', 'Microsoft', 'Google']
     
-    print("Available demo companies:")
-    for i, company in enumerate(demo_companies, 1):
-        print(f"  {i}. {company}")
-    
     # For demo purposes, we'll use Apple
     selected_company = 'Apple'
     
-    print(f"\n🎯 Selected Company: {selected_company}")
-    print("\n📋 This demo will showcase:")
-    print("  ✓ Company research and recent developments")
-    print("  ✓ Quantitative financial analysis") 
-    print("  ✓ Market sentiment evaluation")
-    print("  ✓ Comprehensive investment report generation")
-    
-    print(f"\n⚠️  Note: This is a demonstration using placeholder financial data.")
-    print(f"   For production use, connect to real financial data APIs.")
+    # Write the banner in one call so it is not interleaved with other output
+    sys.stdout.write("\n".join([
+        "🔬 Financial Research Assistant Demo",
+        "=" * 50,
+        "Available demo companies:",
+        *(f"  {i}. {company}" for i, company in enumerate(demo_companies, 1)),
+        f"\n🎯 Selected Company: {selected_company}",
+        "\n📋 This demo will showcase:",
+        "  ✓ Company research and recent developments",
+        "  ✓ Quantitative financial analysis",
+        "  ✓ Market sentiment evaluation",
+        "  ✓ Comprehensive investment report generation",
+        "\n⚠️  Note: This is a demonstration using placeholder financial data.",
+        "   For production use, connect to real financial data APIs.",
+    ]) + "\n")
     
     # Create output directory
     os.makedirs('output', exist_ok=True)
@@ -59,9 +61,8 @@ def demo_financial_research():
         # result = crew.kickoff(inputs=inputs)
         
         print(f"\n✅ Analysis complete! (Demo mode - no actual API calls made)")
-        print(f"📄 Report would be saved to: output/comprehensive_financial_report.md")
+        print(f"📄 Report would be saved to: {REPORT_PATH.format(company=selected_company)}")
         
-        print(f"\n📊 Expected report sections:")
         sections = [
             "Executive Summary",
             "Company Overview", 
@@ -73,8 +74,10 @@ def demo_financial_research():
             "Risk Assessment"
         ]
         
-        for section in sections:
-            print(f"   📋 {section}")
+        sys.stdout.write("\n".join([
+            "\n📊 Expected report sections:",
+            *(f"   📋 {section}" for section in sections),
+        ]) + "\n")
             
     except Exception as e:
         print(f"\n❌ Error: {str(e)}")
@@ -93,23 +96,22 @@ def test_tools():
             FinancialDataTool, SECFilingTool, MarketSentimentTool
         )
         
-        # Test Financial Data Tool
-        print("📊 Testing Financial Data Tool...")
-        fd_tool = FinancialDataTool()
-        result = fd_tool._run("AAPL", "overview")
-        print("✅ Financial Data Tool working")
-        
-        # Test SEC Filing Tool  
-        print("\n📋 Testing SEC Filing Tool...")
-        sec_tool = SECFilingTool()
-        result = sec_tool._run("AAPL", "10-K")
-        print("✅ SEC Filing Tool working")
+        # The probes are independent, so run them concurrently
+        probes = {
+            "📊 Financial Data Tool": (FinancialDataTool(), ("AAPL", "overview")),
+            "📋 SEC Filing Tool": (SECFilingTool(), ("AAPL", "10-K")),
+            "💹 Market Sentiment Tool": (MarketSentimentTool(), ("AAPL", "1w")),
+        }
+        print("Testing Financial Data, SEC Filing and Market Sentiment tools...")
         
-        # Test Market Sentiment Tool
-        print("\n💹 Testing Market Sentiment Tool...")
-        sentiment_tool = MarketSentimentTool()
-        result = sentiment_tool._run("AAPL", "1w")
-        print("✅ Market Sentiment Tool working")
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            futures = {
+                executor.submit(tool._run, *args): name
+                for name, (tool, args) in probes.items()
+            }
+            for future in as_completed(futures):
+                future.result()
+                print(f"✅ {futures[future]} working")
         
         print(f"\n🎉 All financial tools are operational!")
         
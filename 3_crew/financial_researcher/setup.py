@@ -103,10 +103,10 @@ def run_setup():
     try:
         sys.path.append('src')
         from financial_researcher.crew import ResearchCrew
-        crew = ResearchCrew()
+        crew = ResearchCrew().crew()
         print(f"✅ System test passed")
-        print(f"   - {len(crew.crew().agents)} agents ready")
-        print(f"   - {len(crew.crew().tasks)} tasks configured")
+        print(f"   - {len(crew.agents)} agents ready")
+        print(f"   - {len(crew.tasks)} tasks configured")
     except Exception as e:
         print(f"❌ System test failed: {e}")
         return False
@@ -1,8 +1,13 @@
 # src/financial_researcher/crew.py
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from crewai_tools import SerperDevTool, ScrapeWebsiteTool
+from crewai_tools import ScrapeWebsiteTool
 from .tools.financial_tools import FinancialDataTool, SECFilingTool, MarketSentimentTool
+from .tools.search_tools import RateLimitedSerperDevTool
+
+# CrewAI fills {company} in from the kickoff inputs, so concurrent crews
+# researching different companies write separate reports
+REPORT_PATH = 'output/{company}_comprehensive_financial_report.md'
 
 @CrewBase
 class ResearchCrew():
@@ -13,7 +18,7 @@ class ResearchCrew():
         return Agent(
             config=self.agents_config['researcher'],
             verbose=True,
-            tools=[SerperDevTool(), ScrapeWebsiteTool()]
+            tools=[RateLimitedSerperDevTool(), ScrapeWebsiteTool()]
         )
 
     @agent
@@ -29,7 +34,7 @@ class ResearchCrew():
         return Agent(
             config=self.agents_config['sentiment_analyst'],
             verbose=True,
-            tools=[SerperDevTool(), MarketSentimentTool()]
+            tools=[RateLimitedSerperDevTool(), MarketSentimentTool()]
         )
 
     @agent
@@ -42,31 +47,39 @@ class ResearchCrew():
     @task
     def research_task(self) -> Task:
         return Task(
-            config=self.tasks_config['research_task']
+            config=self.tasks_config['research_task'],
+            async_execution=True
         )
 
     @task
     def quantitative_analysis_task(self) -> Task:
         return Task(
-            config=self.tasks_config['quantitative_analysis_task']
+            config=self.tasks_config['quantitative_analysis_task'],
+            async_execution=True
         )
 
     @task
     def sentiment_analysis_task(self) -> Task:
         return Task(
-            config=self.tasks_config['sentiment_analysis_task']
+            config=self.tasks_config['sentiment_analysis_task'],
+            async_execution=True
         )
 
     @task
     def comprehensive_analysis_task(self) -> Task:
         return Task(
             config=self.tasks_config['comprehensive_analysis_task'],
-            output_file='output/comprehensive_financial_report.md'
+            output_file=REPORT_PATH
         )
 
     @crew
     def crew(self) -> Crew:
-        """Creates the comprehensive financial research crew"""
+        """Creates the comprehensive financial research crew
+
+        The research, quantitative and sentiment tasks are independent and run
+        asynchronously; the comprehensive analysis task lists all three as
+        context, so the analyst waits for them and synthesizes the results.
+        """
         return Crew(
             agents=self.agents,
             tasks=self.tasks,
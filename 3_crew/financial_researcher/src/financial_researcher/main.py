@@ -1,12 +1,26 @@
 #!/usr/bin/env python
 # src/financial_researcher/main.py
+import asyncio
 import os
 import sys
-from financial_researcher.crew import ResearchCrew
+import threading
+from financial_researcher.crew import REPORT_PATH, ResearchCrew
 
 
-# Create output directory if it doesn't exist
-os.makedirs('output', exist_ok=True)
+_crew = None
+_crew_lock = threading.Lock()
+
+
+def _get_crew():
+    """
+    Return the research crew, building it (YAML config, agents, tools) only once.
+    """
+    global _crew
+    if _crew is None:
+        with _crew_lock:
+            if _crew is None:
+                _crew = ResearchCrew().crew()
+    return _crew
 
 
 def run():
@@ -22,43 +36,103 @@ def run():
     else:
         company = default_company
     
-    print(f"🔍 Starting comprehensive financial research for: {company}")
-    print("=" * 60)
-    print("This analysis will include:")
-    print("• Company research and recent developments")
-    print("• Quantitative financial analysis")
-    print("• Market sentiment analysis") 
-    print("• Comprehensive investment analysis report")
-    print("=" * 60)
+    sys.stdout.write("\n".join([
+        f"🔍 Starting comprehensive financial research for: {company}",
+        "=" * 60,
+        "This analysis will include:",
+        "• Company research and recent developments",
+        "• Quantitative financial analysis",
+        "• Market sentiment analysis",
+        "• Comprehensive investment analysis report",
+        "=" * 60,
+    ]) + "\n")
     
     inputs = {
         'company': company
     }
 
+    # Create output directory if it doesn't exist
+    os.makedirs('output', exist_ok=True)
+
     try:
         # Create and run the crew
-        result = ResearchCrew().crew().kickoff(inputs=inputs)
+        result = _get_crew().kickoff(inputs=inputs)
 
         # Print the result
-        print("\n\n" + "=" * 60)
-        print("📊 COMPREHENSIVE FINANCIAL ANALYSIS COMPLETE")
-        print("=" * 60)
-        print(result.raw)
-
-        print(f"\n\n✅ Complete financial research report has been saved to:")
-        print(f"   📄 output/comprehensive_financial_report.md")
-        print(f"\n💡 This analysis covers:")
-        print(f"   • Executive summary and investment thesis")
-        print(f"   • Financial performance and ratio analysis")
-        print(f"   • Market sentiment and competitive position")
-        print(f"   • Risk assessment and investment recommendations")
-        print(f"\n⚠️  Disclaimer: This analysis is for informational purposes only")
-        print(f"   and should not be considered as financial advice.")
+        sys.stdout.write("\n".join([
+            "\n\n" + "=" * 60,
+            "📊 COMPREHENSIVE FINANCIAL ANALYSIS COMPLETE",
+            "=" * 60,
+            result.raw,
+            "\n\n✅ Complete financial research report has been saved to:",
+            f"   📄 {REPORT_PATH.format(company=company)}",
+            "\n💡 This analysis covers:",
+            "   • Executive summary and investment thesis",
+            "   • Financial performance and ratio analysis",
+            "   • Market sentiment and competitive position",
+            "   • Risk assessment and investment recommendations",
+            "\n⚠️  Disclaimer: This analysis is for informational purposes only",
+            "   and should not be considered as financial advice.",
+        ]) + "\n")
         
     except Exception as e:
         print(f"\n❌ Error during analysis: {str(e)}")
-        print(f"💡 Make sure you have the required API keys configured in your environment.")
-        print(f"   You may need OPENAI_API_KEY and SERPER_API_KEY for full functionality.")
+        _print_api_key_hint()
+
+
+def _print_api_key_hint():
+    """
+    Suggest checking the API keys after a failed analysis.
+    """
+    print(f"💡 Make sure you have the required API keys configured in your environment.")
+    print(f"   You may need OPENAI_API_KEY and SERPER_API_KEY for full functionality.")
+
+
+async def run_many(companies: list[str], max_parallel: int = 3):
+    """
+    Run the financial research crew for several companies concurrently.
+
+    At most ``max_parallel`` crews are in flight at once so that the OpenAI
+    and Serper rate limits are not exceeded. A company that fails does not
+    stop the others; its exception is returned in place of its result.
+    """
+    semaphore = asyncio.Semaphore(max_parallel)
+
+    async def kickoff(company: str):
+        async with semaphore:
+            return await _get_crew().copy().kickoff_async(inputs={'company': company})
+
+    return await asyncio.gather(*(kickoff(company) for company in companies),
+                                return_exceptions=True)
+
+
+def run_batch():
+    """
+    Run the financial research crew for every company given on the command line.
+    """
+    companies = sys.argv[1:] or ['Apple', 'Tesla', 'Microsoft', 'Google']
+    max_parallel = int(os.getenv('MAX_PARALLEL_CREWS', '3'))
+
+    os.makedirs('output', exist_ok=True)
+    print(f"🔍 Starting financial research for: {', '.join(companies)}")
+    results = asyncio.run(run_many(companies, max_parallel=max_parallel))
+
+    failed = False
+    for company, result in zip(companies, results):
+        if isinstance(result, Exception):
+            failed = True
+            print(f"\n❌ Error during analysis of {company}: {str(result)}")
+            continue
+        sys.stdout.write("\n".join([
+            "\n\n" + "=" * 60,
+            f"📊 {company.upper()} ANALYSIS COMPLETE",
+            "=" * 60,
+            result.raw,
+            f"\n✅ Report saved to: {REPORT_PATH.format(company=company)}",
+        ]) + "\n")
+
+    if failed:
+        _print_api_key_hint()
 
 
 def train():
@@ -69,9 +143,9 @@ def train():
         'company': 'Apple'
     }
     try:
-        ResearchCrew().crew().train(n_iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 1, 
-                                   filename=sys.argv[2] if len(sys.argv) > 2 else None, 
-                                   inputs=inputs)
+        _get_crew().train(n_iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 1, 
+                          filename=sys.argv[2] if len(sys.argv) > 2 else None, 
+                          inputs=inputs)
     except Exception as e:
         raise Exception(f"An error occurred while training the crew: {e}")
 
@@ -81,7 +155,7 @@ def replay():
     Replay the crew execution from a specific task.
     """
     try:
-        ResearchCrew().crew().replay(task_id=sys.argv[1] if len(sys.argv) > 1 else None)
+        _get_crew().replay(task_id=sys.argv[1] if len(sys.argv) > 1 else None)
     except Exception as e:
         raise Exception(f"An error occurred while replaying the crew: {e}")
 
@@ -94,15 +168,18 @@ def test():
         'company': 'Apple'
     }
     try:
-        ResearchCrew().crew().test(n_iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 1, 
-                                  openai_model_name=sys.argv[2] if len(sys.argv) > 2 else None, 
-                                  inputs=inputs)
+        _get_crew().test(n_iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 1, 
+                         openai_model_name=sys.argv[2] if len(sys.argv) > 2 else None, 
+                         inputs=inputs)
     except Exception as e:
         raise Exception(f"An error occurred while testing the crew: {e}")
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1 and sys.argv[1] in ['train', 'replay', 'test']:
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        sys.argv.pop(1)
+        run_batch()
+    elif len(sys.argv) > 1 and sys.argv[1] in ['train', 'replay', 'test']:
         if sys.argv[1] == 'train':
             train()
         elif sys.argv[1] == 'replay':
@@ -1,11 +1,156 @@
 from crewai.tools import BaseTool
-from typing import Type
+from typing import ClassVar, Dict, Type
 from pydantic import BaseModel, Field
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
 import json
+from json.encoder import encode_basestring
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
 from datetime import datetime, timedelta
 
 
+# One pooled session shared by all tools, so repeat calls to the same data
+# provider reuse keep-alive connections instead of a new TCP+TLS handshake.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+))
+
+# Tool results are cached per endpoint so that an agent re-invoking a tool with
+# the same arguments during its reasoning loop does not pay for the request again.
+CACHE_TTLS = {
+    'overview': 24 * 60 * 60,
+    'earnings': 4 * 60 * 60,
+    'ratios': 4 * 60 * 60,
+    'filing': 24 * 60 * 60,
+    'sentiment': 15 * 60,
+}
+CACHE_MAXSIZE = 5000
+
+_cache = OrderedDict()
+_inflight = {}
+_cache_lock = threading.Lock()
+
+
+def _cached(endpoint, fetch, *args):
+    """
+    Return fetch(*args), reusing a previous result until the endpoint TTL expires.
+
+    Concurrent callers asking for the same key while a fetch is in flight wait for
+    that fetch instead of issuing their own upstream request.
+    """
+    key = (endpoint, *args)
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[0] > now:
+            _cache.move_to_end(key)
+            return entry[1]
+        waiter = _inflight.get(key)
+        if waiter is None:
+            _inflight[key] = future = Future()
+
+    if waiter is not None:
+        return waiter.result()
+
+    try:
+        result = fetch(*args)
+    except Exception as e:
+        with _cache_lock:
+            del _inflight[key]
+        future.set_exception(e)
+        raise
+
+    with _cache_lock:
+        _cache[key] = (now + CACHE_TTLS[endpoint], result)
+        _cache.move_to_end(key)
+        if len(_cache) > CACHE_MAXSIZE:
+            _cache.popitem(last=False)
+        del _inflight[key]
+    future.set_result(result)
+    return result
+
+
+@lru_cache(maxsize=4096)
+def _normalize_ticker(ticker: str) -> str:
+    """Canonical form of a ticker symbol; memoized so repeat tickers share one string."""
+    return ticker.upper().strip()
+
+
+def _json_template(data: dict) -> str:
+    """Serialize a demo payload once; its %(name)s placeholders are filled per call."""
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _fill(template: str, **values: str) -> str:
+    """Fill a payload template, JSON-escaping each value."""
+    return template % {key: encode_basestring(value)[1:-1] for key, value in values.items()}
+
+
+# Demo payloads only vary by their arguments, so they are serialized at import time
+_OVERVIEW_TEMPLATE = _json_template({
+    "ticker": "%(ticker)s",
+    "company_name": "%(ticker)s Corporation",
+    "sector": "Technology",
+    "market_cap": "Large Cap",
+    "description": "Financial data for %(ticker)s - this is demo data",
+    "note": "This is demonstration data. In production, connect to financial data APIs."
+})
+
+_EARNINGS_TEMPLATE = _json_template({
+    "ticker": "%(ticker)s",
+    "latest_quarter": "Q3 2024",
+    "eps": "Demo EPS data",
+    "revenue": "Demo revenue data",
+    "note": "This is demonstration data. In production, connect to financial data APIs."
+})
+
+_RATIOS_TEMPLATE = _json_template({
+    "ticker": "%(ticker)s",
+    "pe_ratio": "Demo P/E ratio",
+    "debt_to_equity": "Demo D/E ratio",
+    "roe": "Demo ROE",
+    "note": "This is demonstration data. In production, connect to financial data APIs."
+})
+
+_FILING_TEMPLATE = _json_template({
+    "ticker": "%(ticker)s",
+    "filing_type": "%(filing_type)s",
+    "filing_date": "2024-03-15",
+    "summary": "Demo %(filing_type)s filing analysis for %(ticker)s",
+    "key_points": [
+        "Revenue growth trends",
+        "Risk factors",
+        "Management discussion",
+        "Financial position"
+    ],
+    "note": "This is demonstration data. In production, connect to SEC EDGAR API."
+})
+
+_SENTIMENT_TEMPLATE = _json_template({
+    "ticker": "%(ticker)s",
+    "timeframe": "%(timeframe)s",
+    "sentiment_score": "Neutral (0.1)",
+    "sentiment_range": "-1.0 (Very Negative) to +1.0 (Very Positive)",
+    "key_sentiment_drivers": [
+        "Earnings announcement",
+        "Industry trends",
+        "Market conditions"
+    ],
+    "news_volume": "Moderate",
+    "social_media_mentions": "High",
+    "note": "This is demonstration data. In production, integrate with sentiment analysis APIs."
+})
+
+
 class FinancialDataInput(BaseModel):
     """Input schema for financial data tool."""
     ticker: str = Field(..., description="Stock ticker symbol (e.g., AAPL, GOOGL)")
@@ -20,64 +165,50 @@ class FinancialDataTool(BaseTool):
     )
     args_schema: Type[BaseModel] = FinancialDataInput
 
+    # Supported metrics and the method that produces each one
+    _METRICS: ClassVar[Dict[str, str]] = {
+        'overview': '_get_company_overview',
+        'earnings': '_get_earnings_data',
+        'ratios': '_get_financial_ratios',
+    }
+
     def _run(self, ticker: str, metric: str) -> str:
         """
         Retrieve financial data for a given ticker.
         Note: This is a demo implementation using free APIs.
         """
-        ticker = ticker.upper().strip()
+        ticker = _normalize_ticker(ticker)
         
         try:
-            if metric.lower() == 'overview':
-                return self._get_company_overview(ticker)
-            elif metric.lower() == 'earnings':
-                return self._get_earnings_data(ticker)
-            elif metric.lower() == 'ratios':
-                return self._get_financial_ratios(ticker)
-            else:
-                return f"Available metrics: overview, earnings, ratios. You requested: {metric}"
+            endpoint = metric.lower()
+            method = self._METRICS.get(endpoint)
+            if method is None:
+                return f"Available metrics: {', '.join(self._METRICS)}. You requested: {metric}"
+            return _cached(endpoint, getattr(self, method), ticker)
                 
         except Exception as e:
             return f"Error retrieving financial data for {ticker}: {str(e)}"
 
+    async def _arun(self, ticker: str, metric: str) -> str:
+        """
+        Async variant of _run so the agent can issue several tool calls concurrently.
+        """
+        return await asyncio.to_thread(self._run, ticker, metric)
+
     def _get_company_overview(self, ticker: str) -> str:
         """Get company overview information."""
         # This is a placeholder implementation
         # In a real implementation, you would use APIs like Alpha Vantage, Yahoo Finance, or Polygon
-        overview_data = {
-            "ticker": ticker,
-            "company_name": f"{ticker} Corporation",
-            "sector": "Technology",
-            "market_cap": "Large Cap",
-            "description": f"Financial data for {ticker} - this is demo data",
-            "note": "This is demonstration data. In production, connect to financial data APIs."
-        }
-        
-        return json.dumps(overview_data, indent=2)
+        # through the shared _SESSION (e.g. _SESSION.get(url, params=..., timeout=10))
+        return _fill(_OVERVIEW_TEMPLATE, ticker=ticker)
 
     def _get_earnings_data(self, ticker: str) -> str:
         """Get earnings information."""
-        earnings_data = {
-            "ticker": ticker,
-            "latest_quarter": "Q3 2024",
-            "eps": "Demo EPS data",
-            "revenue": "Demo revenue data",
-            "note": "This is demonstration data. In production, connect to financial data APIs."
-        }
-        
-        return json.dumps(earnings_data, indent=2)
+        return _fill(_EARNINGS_TEMPLATE, ticker=ticker)
 
     def _get_financial_ratios(self, ticker: str) -> str:
         """Get financial ratios."""
-        ratios_data = {
-            "ticker": ticker,
-            "pe_ratio": "Demo P/E ratio",
-            "debt_to_equity": "Demo D/E ratio",
-            "roe": "Demo ROE",
-            "note": "This is demonstration data. In production, connect to financial data APIs."
-        }
-        
-        return json.dumps(ratios_data, indent=2)
+        return _fill(_RATIOS_TEMPLATE, ticker=ticker)
 
 
 class SECFilingInput(BaseModel):
@@ -99,31 +230,27 @@ class SECFilingTool(BaseTool):
         Retrieve SEC filing information.
         Note: This is a demo implementation.
         """
-        ticker = ticker.upper().strip()
+        ticker = _normalize_ticker(ticker)
         filing_type = filing_type.upper().strip()
         
         try:
-            # This is a placeholder implementation
-            # In production, you would use SEC EDGAR API
-            filing_data = {
-                "ticker": ticker,
-                "filing_type": filing_type,
-                "filing_date": "2024-03-15",
-                "summary": f"Demo {filing_type} filing analysis for {ticker}",
-                "key_points": [
-                    "Revenue growth trends",
-                    "Risk factors",
-                    "Management discussion",
-                    "Financial position"
-                ],
-                "note": "This is demonstration data. In production, connect to SEC EDGAR API."
-            }
-            
-            return json.dumps(filing_data, indent=2)
+            return _cached('filing', self._get_filing, ticker, filing_type)
             
         except Exception as e:
             return f"Error retrieving SEC filing for {ticker}: {str(e)}"
 
+    async def _arun(self, ticker: str, filing_type: str) -> str:
+        """
+        Async variant of _run so the agent can issue several tool calls concurrently.
+        """
+        return await asyncio.to_thread(self._run, ticker, filing_type)
+
+    def _get_filing(self, ticker: str, filing_type: str) -> str:
+        """Get SEC filing information."""
+        # This is a placeholder implementation
+        # In production, you would use SEC EDGAR API through the shared _SESSION
+        return _fill(_FILING_TEMPLATE, ticker=ticker, filing_type=filing_type)
+
 
 class MarketSentimentInput(BaseModel):
     """Input schema for market sentiment tool."""
@@ -144,27 +271,22 @@ class MarketSentimentTool(BaseTool):
         Analyze market sentiment for a stock.
         Note: This is a demo implementation.
         """
-        ticker = ticker.upper().strip()
+        ticker = _normalize_ticker(ticker)
         
         try:
-            # This is a placeholder implementation
-            # In production, you would use sentiment analysis APIs
-            sentiment_data = {
-                "ticker": ticker,
-                "timeframe": timeframe,
-                "sentiment_score": "Neutral (0.1)",
-                "sentiment_range": "-1.0 (Very Negative) to +1.0 (Very Positive)",
-                "key_sentiment_drivers": [
-                    "Earnings announcement",
-                    "Industry trends",
-                    "Market conditions"
-                ],
-                "news_volume": "Moderate",
-                "social_media_mentions": "High",
-                "note": "This is demonstration data. In production, integrate with sentiment analysis APIs."
-            }
-            
-            return json.dumps(sentiment_data, indent=2)
+            return _cached('sentiment', self._get_sentiment, ticker, timeframe)
             
         except Exception as e:
-            return f"Error analyzing sentiment for {ticker}: {str(e)}"
\ No newline at end of file
+            return f"Error analyzing sentiment for {ticker}: {str(e)}"
+
+    async def _arun(self, ticker: str, timeframe: str) -> str:
+        """
+        Async variant of _run so the agent can issue several tool calls concurrently.
+        """
+        return await asyncio.to_thread(self._run, ticker, timeframe)
+
+    def _get_sentiment(self, ticker: str, timeframe: str) -> str:
+        """Get market sentiment information."""
+        # This is a placeholder implementation
+        # In production, you would use sentiment analysis APIs through the shared _SESSION
+        return _fill(_SENTIMENT_TEMPLATE, ticker=ticker, timeframe=timeframe)
@@ -0,0 +1,17 @@
+import os
+import threading
+from crewai_tools import SerperDevTool
+
+
+# Shared by every agent and crew in the process, so concurrent kickoffs
+# (e.g. run_many) cannot exceed the Serper API key's rate limit.
+SERPER_MAX_CONCURRENCY = int(os.getenv('SERPER_MAX_CONCURRENCY', '5'))
+_serper_semaphore = threading.BoundedSemaphore(SERPER_MAX_CONCURRENCY)
+
+
+class RateLimitedSerperDevTool(SerperDevTool):
+    """SerperDevTool that caps the number of concurrent search requests."""
+
+    def _run(self, **kwargs):
+        with _serper_semaphore:
+            return super()._run(**kwargs)
@@ -0,0 +1,146 @@
+import threading
+import time
+
+import pytest
+
+import financial_researcher.tools.financial_tools as ft
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    ft._cache.clear()
+    ft._inflight.clear()
+    yield
+    ft._cache.clear()
+    ft._inflight.clear()
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def counting_fetch():
+    calls = []
+
+    def fetch(*args):
+        calls.append(args)
+        return f"result {len(calls)}"
+
+    return fetch, calls
+
+
+def test_cache_hit_until_ttl_expires(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(ft.time, "monotonic", clock)
+    fetch, calls = counting_fetch()
+
+    assert ft._cached("sentiment", fetch, "AAPL", "1d") == "result 1"
+    clock.now += ft.CACHE_TTLS["sentiment"] - 1
+    assert ft._cached("sentiment", fetch, "AAPL", "1d") == "result 1"
+    assert len(calls) == 1
+
+    clock.now += 1
+    assert ft._cached("sentiment", fetch, "AAPL", "1d") == "result 2"
+    assert len(calls) == 2
+
+
+def test_cache_keys_include_endpoint_and_arguments():
+    fetch, calls = counting_fetch()
+
+    ft._cached("overview", fetch, "AAPL")
+    ft._cached("earnings", fetch, "AAPL")
+    ft._cached("overview", fetch, "MSFT")
+    ft._cached("overview", fetch, "AAPL")
+
+    assert calls == [("AAPL",), ("AAPL",), ("MSFT",)]
+
+
+def test_least_recently_used_entry_is_evicted(monkeypatch):
+    monkeypatch.setattr(ft, "CACHE_MAXSIZE", 2)
+    fetch, calls = counting_fetch()
+
+    ft._cached("overview", fetch, "A")
+    ft._cached("overview", fetch, "B")
+    ft._cached("overview", fetch, "A")  # A becomes most recently used
+    ft._cached("overview", fetch, "C")  # evicts B
+
+    assert len(ft._cache) == 2
+    ft._cached("overview", fetch, "A")
+    assert calls == [("A",), ("B",), ("C",)]
+    ft._cached("overview", fetch, "B")
+    assert calls == [("A",), ("B",), ("C",), ("B",)]
+
+
+def run_concurrently(fetch, n_threads):
+    """Call _cached for one key from n_threads threads while the first fetch is blocked."""
+    results = [None] * n_threads
+    errors = [None] * n_threads
+
+    def call(i):
+        try:
+            results[i] = ft._cached("overview", fetch, "AAPL")
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def test_concurrent_callers_share_one_fetch():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch(ticker):
+        calls.append(ticker)
+        started.set()
+        release.wait(5)
+        return "shared"
+
+    threads, results, errors = run_concurrently(fetch, 8)
+    assert started.wait(5)
+    time.sleep(0.1)  # let the other threads queue up behind the in-flight fetch
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == ["AAPL"]
+    assert results == ["shared"] * 8
+    assert errors == [None] * 8
+
+
+def test_fetch_error_reaches_waiters_and_is_not_cached():
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing_fetch(ticker):
+        started.set()
+        release.wait(5)
+        raise RuntimeError("upstream down")
+
+    threads, results, errors = run_concurrently(failing_fetch, 4)
+    assert started.wait(5)
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert all(isinstance(e, RuntimeError) for e in errors)
+    assert results == [None] * 4
+    assert not ft._cache and not ft._inflight
+
+    fetch, calls = counting_fetch()
+    assert ft._cached("overview", fetch, "AAPL") == "result 1"
+    assert calls == [("AAPL",)]
+
+
+def test_sentiment_keeps_caller_timeframe():
+    result = ft.MarketSentimentTool()._run(" tsla ", "1W")
+    assert '"ticker":"TSLA"' in result
+    assert '"timeframe":"1W"' in result
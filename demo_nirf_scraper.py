@@ -7,14 +7,13 @@ without actually accessing the real website (to avoid being blocked).
 """
 
 import os
-import json
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from nirf_pdf_scraper import NIRFPDFScraper
+from nirf_pdf_scraper import NIRFPDFScraper, _write_json
 from nirf_data_analyzer import NIRFDataAnalyzer
 import time
 
-
 def create_demo_data():
     """Create some demo data to show how the system works."""
     
@@ -108,17 +107,21 @@ def create_demo_data():
     ]
     
     # Create demo data files
+    pending_writes = []
     for i, college in enumerate(demo_colleges):
+        safe_name = college['name'].replace(' ', '_')
+        average_score = sum(college["scores"]) / len(college["scores"])
+        
         # Simulate the data structure that would be created by the scraper
         data = {
             "pdf_info": {
-                "url": f"https://example.com/{college['name'].replace(' ', '_')}.pdf",
+                "url": f"https://example.com/{safe_name}.pdf",
                 "college_name": college["name"],
-                "filename": f"{college['name'].replace(' ', '_')}.pdf"
+                "filename": f"{safe_name}.pdf"
             },
             "extracted_data": {
                 "metadata": {
-                    "filename": f"{college['name'].replace(' ', '_')}.pdf",
+                    "filename": f"{safe_name}.pdf",
                     "num_pages": 5 + i,
                     "file_size": 500000 + (i * 100000),
                     "extracted_at": time.strftime('%Y-%m-%d %H:%M:%S')
@@ -129,7 +132,7 @@ def create_demo_data():
                     "location": college["location"],
                     "rank": college["rank"],
                     "scores": college["scores"],
-                    "average_score": sum(college["scores"]) / len(college["scores"])
+                    "average_score": average_score
                 },
                 "word_count": len(college["content"].split()),
                 "char_count": len(college["content"])
@@ -137,14 +140,16 @@ def create_demo_data():
             "processed_at": time.strftime('%Y-%m-%d %H:%M:%S')
         }
         
-        # Save to JSON file
-        filename = f"{college['name'].replace(' ', '_')}_data.json"
-        filepath = data_dir / filename
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        print(f"Created demo data: {filename}")
+        # Queue the JSON file for saving
+        filename = f"{safe_name}_data.json"
+        pending_writes.append((data_dir / filename, data))
+    
+    # The files are independent, so write them concurrently
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(lambda job: _write_json(*job), pending_writes))
+    
+    for filepath, _ in pending_writes:
+        print(f"Created demo data: {filepath.name}")
     
     return temp_dir, download_dir, data_dir
 
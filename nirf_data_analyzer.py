@@ -12,8 +12,9 @@ import json
 import os
 from pathlib import Path
 from typing import List, Dict, Any
-from collections import Counter, defaultdict
 import re
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 try:
     import pandas as pd
@@ -35,6 +36,114 @@ except ImportError:
     plt = None
     sns = None
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Words of three or more letters, as counted by the text statistics. Text is
+# lowercased before matching, so only lowercase letters need to be checked.
+_WORD_RE = re.compile(r'\b[a-z]{3,}\b')
+
+# Shared stand-in for a missing section of a data file; never mutated
+_EMPTY = {}
+
+# Common words left out of the word frequency ranking
+STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'are', 'with', 'this', 'that', 'from', 'they', 'have',
+    'been', 'will', 'their', 'said', 'each', 'which', 'what', 'were', 'more',
+    'than', 'into', 'very', 'after', 'first', 'well', 'year', 'years',
+})
+
+# Engineering-related terms whose frequency is reported separately
+ENGINEERING_TERMS = (
+    'engineering', 'technology', 'technical', 'science', 'research', 'laboratory',
+    'faculty', 'department', 'program', 'course', 'student', 'education',
+    'academic', 'institute', 'university', 'college',
+)
+
+
+def _cached_result(method):
+    """Reuse an analysis method's result until the analyzer's data changes."""
+    @functools.wraps(method)
+    def wrapper(self):
+        if method.__name__ not in self._results:
+            self._results[method.__name__] = method(self)
+        return self._results[method.__name__]
+    return wrapper
+
+
+def _file_size(path: Path) -> int:
+    """Size of a file in bytes, or 0 if it cannot be read."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _load_json(path: Path) -> Dict[str, Any]:
+    """Read and parse a single JSON data file, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _records(df, columns: List[str]) -> List[Dict[str, Any]]:
+    """Rows of df as plain dicts over the given columns; missing integers become None."""
+    values = [[None if value is pd.NA else value for value in df[column].tolist()]
+              for column in columns]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+def _set_plot_style() -> None:
+    """Apply the plot style; called in each worker process before drawing."""
+    # Plots are only saved to files, so the worker skips GUI backends. This
+    # only affects the worker process, not the importer's backend.
+    plt.switch_backend('Agg')
+    plt.style.use('default')
+    sns.set_palette("husl")
+
+
+def _plot_histogram(values, xlabel: str, title: str, path: Path) -> None:
+    """Save a histogram of values, counted per college."""
+    _set_plot_style()
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.hist(values, bins=20, alpha=0.7)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel('Number of Colleges')
+    ax.set_title(title)
+    fig.savefig(path, dpi=300, bbox_inches='tight')
+    plt.close(fig)
+
+
+def _plot_pages_vs_words(num_pages, word_counts, path: Path) -> None:
+    """Save a scatter plot of page count against word count."""
+    _set_plot_style()
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.scatter(num_pages, word_counts, alpha=0.6)
+    ax.set_xlabel('Number of Pages')
+    ax.set_ylabel('Word Count')
+    ax.set_title('Pages vs Word Count')
+    fig.savefig(path, dpi=300, bbox_inches='tight')
+    plt.close(fig)
+
+
+def _plot_location_counts(locations: List[str], counts: List[int], path: Path) -> None:
+    """Save a bar chart of the number of colleges per location."""
+    _set_plot_style()
+    fig, ax = plt.subplots(figsize=(12, 8))
+    pd.Series(counts, index=locations).plot(kind='bar', ax=ax)
+    ax.set_xlabel('Location')
+    ax.set_ylabel('Number of Colleges')
+    ax.set_title('Top 15 Locations by Number of Colleges')
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    fig.tight_layout()
+    fig.savefig(path, dpi=300, bbox_inches='tight')
+    plt.close(fig)
+
 
 class NIRFDataAnalyzer:
     """
@@ -50,7 +159,10 @@ class NIRFDataAnalyzer:
         """
         self.data_dir = Path(data_dir)
         self.data = []
-        self.df = None
+        self._df = None
+        self._texts = None
+        self._tokens = None
+        self._results = {}
         
         if not self.data_dir.exists():
             print(f"Data directory {data_dir} does not exist. Please run the scraper first.")
@@ -60,22 +172,48 @@ class NIRFDataAnalyzer:
     
     def load_data(self) -> None:
         """Load all JSON data files from the data directory."""
-        json_files = list(self.data_dir.glob("*_data.json"))
+        json_files = sorted(self.data_dir.glob("*_data.json"))
+        self._df = None
+        self._texts = None
+        self._tokens = None
+        self._results = {}
         
         print(f"Found {len(json_files)} data files to analyze")
         
-        for json_file in json_files:
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.data.append(data)
-            except Exception as e:
-                print(f"Error loading {json_file}: {e}")
+        # Files are independent, so read and parse them concurrently. The
+        # largest files are submitted first so they do not finish last, while
+        # results are still collected in filename order.
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {json_file: executor.submit(_load_json, json_file)
+                       for json_file in sorted(json_files, key=_file_size, reverse=True)}
+            for json_file in json_files:
+                future = futures[json_file]
+                try:
+                    self.data.append(future.result())
+                except Exception as e:
+                    print(f"Error loading {json_file}: {e}")
         
         print(f"Successfully loaded {len(self.data)} data files")
-        
-        if self.data:
+    
+    @property
+    def df(self):
+        """DataFrame view of the loaded data, built on first access."""
+        if self._df is None and self.data and PANDAS_AVAILABLE:
             self.create_dataframe()
+        return self._df
+    
+    def _document_texts(self) -> List[str]:
+        """Full text of each document, in the same order as self.data."""
+        if self._texts is None:
+            self._texts = [(item.get('extracted_data') or _EMPTY).get('full_text', '') for item in self.data]
+        return self._texts
+    
+    def _document_tokens(self) -> List[List[str]]:
+        """Lowercased words of each document's text, tokenized once and reused."""
+        if self._tokens is None:
+            self._tokens = [_WORD_RE.findall(text.lower()) for text in self._document_texts()]
+        return self._tokens
     
     def create_dataframe(self) -> None:
         """Create a pandas DataFrame from the loaded data."""
@@ -83,51 +221,83 @@ class NIRFDataAnalyzer:
             print("Pandas not available. Skipping DataFrame creation.")
             return
             
-        records = []
-        
-        for item in self.data:
-            record = {}
-            
+        # Build the frame column-wise; pandas handles a dict of lists much
+        # faster than a list of per-row dicts
+        columns = {name: [] for name in (
+            'filename', 'college_name', 'location', 'rank',
+            'file_size', 'num_pages', 'word_count', 'char_count',
+            'num_scores', 'average_score', 'max_score', 'min_score',
+            'text_length', 'unique_words',
+            'processed_at', 'extraction_successful',
+        )}
+        all_scores = []
+        
+        for item, full_text in zip(self.data, self._document_texts()):
             # Extract basic info
-            pdf_info = item.get('pdf_info', {})
-            extracted_data = item.get('extracted_data', {})
-            structured_data = extracted_data.get('structured_data', {})
-            metadata = extracted_data.get('metadata', {})
+            pdf_info = item.get('pdf_info') or _EMPTY
+            extracted_data = item.get('extracted_data') or _EMPTY
+            structured_data = extracted_data.get('structured_data') or _EMPTY
+            metadata = extracted_data.get('metadata') or _EMPTY
             
             # Basic information
-            record['filename'] = pdf_info.get('filename', 'unknown')
-            record['college_name'] = (structured_data.get('college_name') or 
-                                    pdf_info.get('college_name', 'unknown'))
-            record['location'] = structured_data.get('location', 'unknown')
-            record['rank'] = structured_data.get('rank')
+            columns['filename'].append(pdf_info.get('filename', 'unknown'))
+            columns['college_name'].append(structured_data.get('college_name') or 
+                                           pdf_info.get('college_name', 'unknown'))
+            columns['location'].append(structured_data.get('location', 'unknown'))
+            columns['rank'].append(structured_data.get('rank'))
             
             # File metadata
-            record['file_size'] = metadata.get('file_size', 0)
-            record['num_pages'] = metadata.get('num_pages', 0)
-            record['word_count'] = extracted_data.get('word_count', 0)
-            record['char_count'] = extracted_data.get('char_count', 0)
+            columns['file_size'].append(metadata.get('file_size', 0))
+            columns['num_pages'].append(metadata.get('num_pages', 0))
+            columns['word_count'].append(extracted_data.get('word_count', 0))
+            columns['char_count'].append(extracted_data.get('char_count', 0))
             
             # Scores and ratings
             scores = structured_data.get('scores', [])
-            record['num_scores'] = len(scores)
-            record['average_score'] = structured_data.get('average_score')
-            record['max_score'] = max(scores) if scores else None
-            record['min_score'] = min(scores) if scores else None
+            columns['num_scores'].append(len(scores))
+            columns['average_score'].append(structured_data.get('average_score'))
+            all_scores.extend(scores)
             
             # Text analysis
-            full_text = extracted_data.get('full_text', '')
-            record['text_length'] = len(full_text)
-            record['unique_words'] = len(set(full_text.lower().split())) if full_text else 0
+            columns['text_length'].append(len(full_text))
+            columns['unique_words'].append(len(set(full_text.lower().split())) if full_text else 0)
             
             # Processing info
-            record['processed_at'] = item.get('processed_at')
-            record['extraction_successful'] = len(full_text) > 0
-            
-            records.append(record)
-        
-        self.df = pd.DataFrame(records)
-        print(f"Created DataFrame with {len(self.df)} rows and {len(self.df.columns)} columns")
+            columns['processed_at'].append(item.get('processed_at'))
+            columns['extraction_successful'].append(len(full_text) > 0)
+        
+        # Per-college score extremes, reduced over one flat array of all scores
+        num_scores = np.asarray(columns['num_scores'], dtype=np.int64)
+        has_scores = num_scores > 0
+        max_scores = np.full(len(num_scores), np.nan)
+        min_scores = np.full(len(num_scores), np.nan)
+        if has_scores.any():
+            flat_scores = np.asarray(all_scores, dtype=np.float64)
+            starts = (np.cumsum(num_scores) - num_scores)[has_scores]
+            max_scores[has_scores] = np.maximum.reduceat(flat_scores, starts)
+            min_scores[has_scores] = np.minimum.reduceat(flat_scores, starts)
+        columns['max_score'] = max_scores
+        columns['min_score'] = min_scores
+        
+        # Integer columns use the nullable Int64 dtype so a missing rank stays
+        # <NA> instead of turning the whole column into floats
+        self._df = pd.DataFrame(columns).astype({
+            'rank': 'Int64',
+            'file_size': 'Int64',
+            'num_pages': 'Int64',
+            'word_count': 'Int64',
+            'char_count': 'Int64',
+            'num_scores': 'Int64',
+        })
+        
+        # Masks of the rows that have a rank / an average score, shared by the
+        # statistics, college analysis and plots
+        self._rank_mask = self._df['rank'].notna().to_numpy()
+        self._scored_mask = self._df['average_score'].notna().to_numpy()
+        self._results = {}
+        print(f"Created DataFrame with {len(self._df)} rows and {len(self._df.columns)} columns")
     
+    @_cached_result
     def basic_statistics(self) -> Dict[str, Any]:
         """Generate basic statistics about the data."""
         if not self.data:
@@ -141,8 +311,7 @@ class NIRFDataAnalyzer:
             }
             
             # Count successful extractions
-            successful = sum(1 for item in self.data 
-                           if item.get('extracted_data', {}).get('full_text', ''))
+            successful = sum(1 for text in self._document_texts() if text)
             stats["successful_extractions"] = successful
             stats["failed_extractions"] = len(self.data) - successful
             stats["success_rate"] = f"{(successful / len(self.data) * 100):.1f}%" if self.data else "0%"
@@ -155,8 +324,8 @@ class NIRFDataAnalyzer:
         
         stats = {
             "total_colleges": len(self.df),
-            "successful_extractions": self.df['extraction_successful'].sum(),
-            "failed_extractions": (~self.df['extraction_successful']).sum(),
+            "successful_extractions": int(self.df['extraction_successful'].sum()),
+            "failed_extractions": int((~self.df['extraction_successful']).sum()),
             "success_rate": f"{(self.df['extraction_successful'].sum() / len(self.df) * 100):.1f}%"
         }
         
@@ -176,7 +345,7 @@ class NIRFDataAnalyzer:
             stats["total_words_extracted"] = int(self.df['word_count'].sum())
         
         # Ranking statistics
-        ranked_colleges = self.df[self.df['rank'].notna()]
+        ranked_colleges = self.df[self._rank_mask]
         if not ranked_colleges.empty:
             stats["colleges_with_rank"] = len(ranked_colleges)
             stats["highest_rank"] = int(ranked_colleges['rank'].min())
@@ -184,6 +353,7 @@ class NIRFDataAnalyzer:
         
         return stats
     
+    @_cached_result
     def analyze_colleges(self) -> Dict[str, Any]:
         """Analyze college-specific information."""
         if self.df is None or self.df.empty:
@@ -191,32 +361,34 @@ class NIRFDataAnalyzer:
         
         analysis = {}
         
-        # Top colleges by rank
-        ranked_df = self.df[self.df['rank'].notna()].sort_values('rank')
-        if not ranked_df.empty:
-            analysis["top_10_colleges"] = ranked_df[['college_name', 'rank', 'location']].head(10).to_dict('records')
+        # Top colleges by rank, selecting the best ten from the rank column
+        # alone instead of filtering and sorting the whole frame
+        top_ranked = self.df['rank'][self._rank_mask].nsmallest(10).index
+        if not top_ranked.empty:
+            analysis["top_10_colleges"] = (
+                _records(self.df.loc[top_ranked], ['college_name', 'rank', 'location'])
+            )
         
         # Colleges by location
         location_counts = self.df['location'].value_counts()
         analysis["colleges_by_location"] = location_counts.head(10).to_dict()
         
         # Score analysis
-        scored_df = self.df[self.df['average_score'].notna()]
-        if not scored_df.empty:
+        top_scored = self.df['average_score'][self._scored_mask].astype(float).nlargest(10).index
+        if not top_scored.empty:
             analysis["highest_scoring_colleges"] = (
-                scored_df.nlargest(10, 'average_score')[['college_name', 'average_score', 'rank']]
-                .to_dict('records')
+                _records(self.df.loc[top_scored], ['college_name', 'average_score', 'rank'])
             )
         
         # File size analysis (might indicate data richness)
         if 'file_size' in self.df.columns:
             analysis["largest_files"] = (
-                self.df.nlargest(5, 'file_size')[['college_name', 'file_size', 'num_pages']]
-                .to_dict('records')
+                _records(self.df.nlargest(5, 'file_size'), ['college_name', 'file_size', 'num_pages'])
             )
         
         return analysis
     
+    @_cached_result
     def text_analysis(self) -> Dict[str, Any]:
         """Analyze text content across all PDFs."""
         if self.df is None or self.df.empty:
@@ -224,30 +396,25 @@ class NIRFDataAnalyzer:
         
         analysis = {}
         
-        # Combine all text for analysis
-        all_text = ""
-        for item in self.data:
-            full_text = item.get('extracted_data', {}).get('full_text', '')
-            all_text += full_text + " "
-        
-        if not all_text.strip():
+        # Count words with pandas' hash-based value_counts rather than a Counter
+        words = pd.Series(
+            [word for tokens in self._document_tokens() for word in tokens], dtype=object
+        )
+        if words.empty:
             return {"error": "No text data available"}
+        word_freq = words.value_counts()
         
-        # Word frequency analysis
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', all_text.lower())
-        word_freq = Counter(words)
+        # Remove common stop words. word_freq is sorted by count, so the top 20
+        # non-stop words are always within the first 20 + len(STOP_WORDS) entries
+        candidates = word_freq.head(20 + len(STOP_WORDS))
+        filtered_freq = candidates[~candidates.index.isin(STOP_WORDS)]
         
-        # Remove common stop words
-        stop_words = {'the', 'and', 'for', 'are', 'with', 'this', 'that', 'from', 'they', 'have', 'been', 'will', 'their', 'said', 'each', 'which', 'what', 'were', 'been', 'more', 'than', 'into', 'very', 'after', 'first', 'well', 'year', 'years'}
-        filtered_freq = {word: count for word, count in word_freq.items() if word not in stop_words}
-        
-        analysis["most_common_words"] = dict(Counter(filtered_freq).most_common(20))
+        analysis["most_common_words"] = {word: int(count) for word, count in filtered_freq.head(20).items()}
         analysis["total_unique_words"] = len(word_freq)
         analysis["total_words"] = len(words)
         
         # Look for specific engineering-related terms
-        engineering_terms = ['engineering', 'technology', 'technical', 'science', 'research', 'laboratory', 'faculty', 'department', 'program', 'course', 'student', 'education', 'academic', 'institute', 'university', 'college']
-        engineering_freq = {term: word_freq.get(term, 0) for term in engineering_terms}
+        engineering_freq = {term: int(word_freq.get(term, 0)) for term in ENGINEERING_TERMS}
         analysis["engineering_terms_frequency"] = {k: v for k, v in engineering_freq.items() if v > 0}
         
         return analysis
@@ -265,57 +432,45 @@ class NIRFDataAnalyzer:
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
         
-        # Set style
-        plt.style.use('default')
-        sns.set_palette("husl")
+        # Collect the data for each plot, then render them in worker processes.
+        # Only plain arrays are sent to the workers, not the analyzer.
+        plots = []
         
         # 1. Distribution of file sizes
         if 'file_size' in self.df.columns and self.df['file_size'].notna().any():
-            plt.figure(figsize=(10, 6))
             self.df['file_size_mb'] = self.df['file_size'] / (1024 * 1024)
-            plt.hist(self.df['file_size_mb'].dropna(), bins=20, alpha=0.7)
-            plt.xlabel('File Size (MB)')
-            plt.ylabel('Number of Colleges')
-            plt.title('Distribution of PDF File Sizes')
-            plt.savefig(output_path / 'file_size_distribution.png', dpi=300, bbox_inches='tight')
-            plt.close()
+            plots.append((_plot_histogram, self.df['file_size_mb'].dropna().to_numpy(dtype=float),
+                          'File Size (MB)', 'Distribution of PDF File Sizes',
+                          output_path / 'file_size_distribution.png'))
         
         # 2. Pages vs Word Count
         if 'num_pages' in self.df.columns and 'word_count' in self.df.columns:
             valid_data = self.df[(self.df['num_pages'] > 0) & (self.df['word_count'] > 0)]
             if not valid_data.empty:
-                plt.figure(figsize=(10, 6))
-                plt.scatter(valid_data['num_pages'], valid_data['word_count'], alpha=0.6)
-                plt.xlabel('Number of Pages')
-                plt.ylabel('Word Count')
-                plt.title('Pages vs Word Count')
-                plt.savefig(output_path / 'pages_vs_words.png', dpi=300, bbox_inches='tight')
-                plt.close()
+                plots.append((_plot_pages_vs_words,
+                              valid_data['num_pages'].to_numpy(dtype=float),
+                              valid_data['word_count'].to_numpy(dtype=float),
+                              output_path / 'pages_vs_words.png'))
         
         # 3. Top locations
         if 'location' in self.df.columns:
             location_counts = self.df['location'].value_counts().head(15)
             if not location_counts.empty:
-                plt.figure(figsize=(12, 8))
-                location_counts.plot(kind='bar')
-                plt.xlabel('Location')
-                plt.ylabel('Number of Colleges')
-                plt.title('Top 15 Locations by Number of Colleges')
-                plt.xticks(rotation=45, ha='right')
-                plt.tight_layout()
-                plt.savefig(output_path / 'colleges_by_location.png', dpi=300, bbox_inches='tight')
-                plt.close()
+                plots.append((_plot_location_counts, location_counts.index.tolist(),
+                              location_counts.tolist(), output_path / 'colleges_by_location.png'))
         
         # 4. Rank distribution
-        ranked_df = self.df[self.df['rank'].notna()]
+        ranked_df = self.df[self._rank_mask]
         if not ranked_df.empty:
-            plt.figure(figsize=(10, 6))
-            plt.hist(ranked_df['rank'], bins=20, alpha=0.7)
-            plt.xlabel('Rank')
-            plt.ylabel('Number of Colleges')
-            plt.title('Distribution of College Rankings')
-            plt.savefig(output_path / 'rank_distribution.png', dpi=300, bbox_inches='tight')
-            plt.close()
+            plots.append((_plot_histogram, ranked_df['rank'].to_numpy(dtype=float),
+                          'Rank', 'Distribution of College Rankings',
+                          output_path / 'rank_distribution.png'))
+        
+        if plots:
+            with ProcessPoolExecutor(max_workers=len(plots)) as executor:
+                futures = [executor.submit(plot, *args) for plot, *args in plots]
+                for future in futures:
+                    future.result()
         
         print(f"Visualizations saved to {output_path}")
     
@@ -340,8 +495,15 @@ class NIRFDataAnalyzer:
             }
         
         output_path = Path(output_file)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+        if ORJSON_AVAILABLE:
+            output_path.write_bytes(orjson.dumps(
+                report,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+                default=str,
+            ))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False, default=str)
         
         print(f"Analysis report exported to {output_path}")
     
@@ -11,9 +11,16 @@ Date: 2025
 
 import os
 import json
+import shutil
 import time
+import asyncio
 import logging
+import multiprocessing
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from pathlib import Path
@@ -21,6 +28,241 @@ import pypdf
 from typing import List, Dict, Optional
 import re
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    aiohttp = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+    pdfium = None
+
+
+# Patterns used to pick structured fields out of the extracted PDF text,
+# compiled once and tried in order
+COLLEGE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'College[:\s]+([^\n]+)',
+    r'Institute[:\s]+([^\n]+)',
+    r'University[:\s]+([^\n]+)',
+    r'Name[:\s]+([^\n]+)'
+)]
+LOCATION_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Address[:\s]+([^\n]+)',
+    r'Location[:\s]+([^\n]+)',
+    r'City[:\s]+([^\n]+)',
+    r'State[:\s]+([^\n]+)'
+)]
+RANKING_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Rank[:\s]+(\d+)',
+    r'Position[:\s]+(\d+)',
+    r'#(\d+)'
+)]
+SCORE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Score[:\s]+([\d.]+)',
+    r'Rating[:\s]+([\d.]+)',
+    r'Points[:\s]+([\d.]+)'
+)]
+
+_NUMBER_RE = re.compile(r'\d+\.?\d*')
+# Links to PDF files, allowing a query string or fragment after the extension
+_PDF_URL_RE = re.compile(r'\.pdf(?:[?#]|$)', re.IGNORECASE)
+_UNSAFE_CHARS_RE = re.compile(r'[^\w\s-]')
+# ASCII characters matched by _UNSAFE_CHARS_RE, deleted with bytes.translate
+# on the ASCII fast path
+_UNSAFE_ASCII_BYTES = bytes(
+    c for c in range(128) if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in '_-')
+)
+_RANKING_ROW_CLASS_RE = re.compile(r'rank|college|institution', re.I)
+
+# Downloads are streamed in large chunks so a typical PDF takes only a few writes
+DOWNLOAD_CHUNK_SIZE = 1 << 18
+
+# HEAD requests are cheap, so links are checked with more concurrency than downloads
+MAX_CONCURRENT_PROBES = 32
+
+# Retry policy for transient server errors, shared by the requests session
+# and the aiohttp downloads
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUSES = (502, 503, 504)
+
+
+logger = logging.getLogger(__name__)
+
+
+def _strip_unsafe_chars(text: str) -> str:
+    """Remove everything except word characters, whitespace and hyphens."""
+    if text.isascii():
+        return text.encode('ascii').translate(None, _UNSAFE_ASCII_BYTES).decode('ascii')
+    return _UNSAFE_CHARS_RE.sub('', text)
+
+
+# Document information fields copied into the extracted metadata
+PDF_INFO_FIELDS = ('Title', 'Author', 'Subject', 'Creator')
+
+
+def _pypdf_document(file):
+    """
+    Open a PDF with pypdf.
+    
+    Returns:
+        Tuple of (page count, document information, page text function)
+    """
+    pdf_reader = pypdf.PdfReader(file)
+    # pypdf rebuilds the document information object on every .metadata access
+    document_info = pdf_reader.metadata
+    info = {}
+    if document_info:
+        info = {field: document_info.get('/' + field, '') for field in PDF_INFO_FIELDS}
+    return len(pdf_reader.pages), info, lambda index: pdf_reader.pages[index].extract_text()
+
+
+def _pdfium_page_text(document, index: int) -> str:
+    """Extract the text of one page with PDFium."""
+    page = document[index]
+    textpage = page.get_textpage()
+    try:
+        # PDFium separates lines with CRLF; the field patterns expect LF
+        return textpage.get_text_range().replace('\r\n', '\n')
+    finally:
+        textpage.close()
+        page.close()
+
+
+def _pdfium_document(document):
+    """
+    Wrap an open pypdfium2 document.
+    
+    Returns:
+        Tuple of (page count, document information, page text function)
+    """
+    info = document.get_metadata_dict(skip_empty=True)
+    return len(document), info, lambda index: _pdfium_page_text(document, index)
+
+
+def _read_pdf(pdf_path: Path) -> Dict[str, any]:
+    """
+    Read the metadata and page text of a PDF file.
+    
+    Text is extracted with PDFium when pypdfium2 is installed, which is much
+    faster than pypdf, and with pypdf otherwise.
+    
+    This is a module-level function so it can run in a worker process.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        
+    Returns:
+        Dictionary with the PDF's metadata, full text and per-page text
+    """
+    logger.info(f"Extracting text from: {pdf_path.name}")
+    
+    with open(pdf_path, 'rb') as file:
+        file_size = os.fstat(file.fileno()).st_size
+        if PDFIUM_AVAILABLE:
+            document = pdfium.PdfDocument(file)
+            try:
+                return _read_pages(pdf_path, file_size, *_pdfium_document(document))
+            finally:
+                document.close()
+        return _read_pages(pdf_path, file_size, *_pypdf_document(file))
+
+
+def _read_pages(pdf_path: Path, file_size: int, num_pages: int, info: Dict[str, any],
+                page_text) -> Dict[str, any]:
+    """Build the extraction result from an opened document."""
+    # Extract metadata
+    metadata = {
+        'filename': pdf_path.name,
+        'num_pages': num_pages,
+        'file_size': file_size,
+        'extracted_at': time.strftime('%Y-%m-%d %H:%M:%S')
+    }
+    
+    # Try to get PDF metadata
+    if info:
+        metadata.update({
+            field.lower(): str(info.get(field, '')) for field in PDF_INFO_FIELDS
+        })
+    
+    # Extract text from all pages. Each page's text is stored once, in
+    # full_text; pages record where it starts so it can be sliced back out.
+    # The pieces are joined once at the end rather than concatenated per page.
+    text_parts = []
+    offset = 0
+    page_texts = []
+    
+    for page_num in range(num_pages):
+        try:
+            text = page_text(page_num)
+            page_texts.append({
+                'page_number': page_num + 1,
+                'char_start': offset,
+                'char_count': len(text)
+            })
+            text_parts.extend((text, "\n"))
+            offset += len(text) + 1
+        except Exception as e:
+            logger.warning(f"Error extracting text from page {page_num + 1}: {e}")
+            page_texts.append({
+                'page_number': page_num + 1,
+                'char_start': offset,
+                'char_count': 0,
+                'error': str(e)
+            })
+    
+    return {
+        'metadata': metadata,
+        'full_text': "".join(text_parts),
+        'pages': page_texts
+    }
+
+
+def _partial_download_path(filepath: Path) -> Path:
+    """Path a download is written to until it completes and is renamed into place."""
+    return filepath.with_name(filepath.name + '.part')
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether an aiohttp download error is transient and worth retrying."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in RETRY_STATUSES
+    return isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError,
+                              asyncio.TimeoutError))
+
+
+def _write_json(filepath: Path, data: dict) -> None:
+    """Write data as indented UTF-8 JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _failed_extraction(pdf_path: Path, error: Exception) -> Dict[str, any]:
+    """Extraction result recorded for a PDF that could not be read."""
+    return {
+        'metadata': {'filename': pdf_path.name, 'error': str(error)},
+        'full_text': '',
+        'pages': [],
+        'structured_data': {},
+        'word_count': 0,
+        'char_count': 0
+    }
+
 
 class NIRFPDFScraper:
     """
@@ -30,7 +272,8 @@ class NIRFPDFScraper:
     
     def __init__(self, base_url: str = "https://www.nirfindia.org/Rankings/2024/EngineeringRanking.html", 
                  download_dir: str = "nirf_pdfs", 
-                 data_dir: str = "nirf_data"):
+                 data_dir: str = "nirf_data",
+                 max_concurrent_downloads: int = 8):
         """
         Initialize the scraper.
         
@@ -38,12 +281,26 @@ class NIRFPDFScraper:
             base_url: The URL to scrape PDFs from
             download_dir: Directory to save downloaded PDFs
             data_dir: Directory to save extracted data
+            max_concurrent_downloads: Maximum number of PDFs downloaded at once
+                when aiohttp is available
         """
         self.base_url = base_url
         self.download_dir = Path(download_dir)
         self.data_dir = Path(data_dir)
+        self.max_concurrent_downloads = max_concurrent_downloads
         self.session = requests.Session()
         
+        # Reuse keep-alive connections to the rankings host across the listing
+        # page and every PDF download, retrying transient server errors
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=16,
+            max_retries=Retry(total=MAX_RETRIES, backoff_factor=RETRY_BACKOFF_FACTOR,
+                              status_forcelist=RETRY_STATUSES),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Create directories if they don't exist
         self.download_dir.mkdir(exist_ok=True)
         self.data_dir.mkdir(exist_ok=True)
@@ -69,8 +326,9 @@ class NIRFPDFScraper:
             response = self.session.get(self.base_url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             pdf_links = []
+            seen = set()
             
             # Find all links that point to PDF files
             # This is a generic approach that should work for most ranking websites
@@ -78,39 +336,43 @@ class NIRFPDFScraper:
             
             for link in all_links:
                 href = link.get('href', '')
-                if href.lower().endswith('.pdf'):
+                if _PDF_URL_RE.search(href):
                     # Get the full URL
                     full_url = urljoin(self.base_url, href)
                     
                     # Try to extract college name from link text or nearby text
                     college_name = self._extract_college_name(link, soup)
                     
+                    filename = self._generate_filename(college_name, href)
+                    seen.add((full_url, college_name, filename))
                     pdf_links.append({
                         'url': full_url,
                         'college_name': college_name,
-                        'filename': self._generate_filename(college_name, href)
+                        'filename': filename
                     })
             
             # Alternative approach: Look for specific patterns in NIRF website
             # Find table rows or div elements that contain ranking information
-            ranking_rows = soup.find_all(['tr', 'div'], class_=re.compile(r'rank|college|institution', re.I))
+            ranking_rows = soup.find_all(['tr', 'div'], class_=_RANKING_ROW_CLASS_RE)
             
             for row in ranking_rows:
-                pdf_link = row.find('a', href=lambda x: x and x.lower().endswith('.pdf'))
+                pdf_link = row.find('a', href=_PDF_URL_RE)
                 if pdf_link:
                     href = pdf_link.get('href', '')
                     full_url = urljoin(self.base_url, href)
                     college_name = self._extract_college_name_from_row(row)
                     
-                    pdf_info = {
-                        'url': full_url,
-                        'college_name': college_name,
-                        'filename': self._generate_filename(college_name, href)
-                    }
+                    filename = self._generate_filename(college_name, href)
                     
                     # Avoid duplicates
-                    if pdf_info not in pdf_links:
-                        pdf_links.append(pdf_info)
+                    key = (full_url, college_name, filename)
+                    if key not in seen:
+                        seen.add(key)
+                        pdf_links.append({
+                            'url': full_url,
+                            'college_name': college_name,
+                            'filename': filename
+                        })
             
             self.logger.info(f"Found {len(pdf_links)} PDF links")
             return pdf_links
@@ -166,8 +428,7 @@ class NIRFPDFScraper:
     def _clean_college_name(self, name: str) -> str:
         """Clean and standardize college name."""
         # Remove extra whitespace and special characters
-        name = re.sub(r'\s+', ' ', name.strip())
-        name = re.sub(r'[^\w\s-]', '', name)
+        name = _strip_unsafe_chars(' '.join(name.split()))
         return name[:100]  # Limit length
     
     def _generate_filename(self, college_name: str, original_href: str) -> str:
@@ -175,12 +436,11 @@ class NIRFPDFScraper:
         # Use college name if available, otherwise use original filename
         if college_name and college_name.strip():
             # Clean the name for filename use
-            clean_name = re.sub(r'[^\w\s-]', '', college_name)
-            clean_name = re.sub(r'\s+', '_', clean_name.strip())
+            clean_name = '_'.join(_strip_unsafe_chars(college_name).split())
             return f"{clean_name}.pdf"
         else:
-            # Use original filename
-            return os.path.basename(original_href)
+            # Use original filename, without any query string or fragment
+            return os.path.basename(urlparse(original_href).path)
     
     def download_pdf(self, pdf_info: Dict[str, str]) -> Optional[Path]:
         """
@@ -197,27 +457,33 @@ class NIRFPDFScraper:
             filename = pdf_info['filename']
             filepath = self.download_dir / filename
             
-            # Skip if file already exists
+            # Skip if file already exists. Interrupted downloads only ever
+            # leave a .part file behind, so an existing file is complete.
             if filepath.exists():
                 self.logger.info(f"File already exists: {filename}")
                 return filepath
             
-            self.logger.info(f"Downloading: {filename}")
-            response = self.session.get(url, timeout=60, stream=True)
-            response.raise_for_status()
-            
-            # Check if it's actually a PDF
-            content_type = response.headers.get('content-type', '').lower()
-            if 'pdf' not in content_type and not url.lower().endswith('.pdf'):
-                self.logger.warning(f"File might not be a PDF: {filename}")
-            
-            # Download with progress
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            part_path = _partial_download_path(filepath)
+            try:
+                self.logger.info(f"Downloading: {filename}")
+                response = self.session.get(url, timeout=60, stream=True)
+                response.raise_for_status()
+                
+                # Check if it's actually a PDF
+                content_type = response.headers.get('content-type', '').lower()
+                if 'pdf' not in content_type and not _PDF_URL_RE.search(url):
+                    self.logger.warning(f"File might not be a PDF: {filename}")
+                
+                # Copy the body straight from the socket stream to the file
+                with open(part_path, 'wb') as f:
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
+                    size = f.tell()
+                os.replace(part_path, filepath)
+            finally:
+                part_path.unlink(missing_ok=True)
             
-            self.logger.info(f"Downloaded: {filename} ({filepath.stat().st_size} bytes)")
+            self.logger.info(f"Downloaded: {filename} ({size} bytes)")
             return filepath
             
         except requests.exceptions.RequestException as e:
@@ -227,6 +493,244 @@ class NIRFPDFScraper:
             self.logger.error(f"Unexpected error downloading {pdf_info['filename']}: {e}")
             return None
     
+    async def _download_pdf_async(self, session, pdf_info: Dict[str, str],
+                                  semaphore: asyncio.Semaphore) -> Optional[Path]:
+        """
+        Download a single PDF file over a shared aiohttp session.
+        
+        Args:
+            session: aiohttp.ClientSession shared by all downloads
+            pdf_info: Dictionary containing PDF URL, college name, and filename
+            semaphore: Limits the number of downloads in flight
+            
+        Returns:
+            Path to downloaded file or None if failed
+        """
+        url = pdf_info['url']
+        filename = pdf_info['filename']
+        filepath = self.download_dir / filename
+        
+        try:
+            async with semaphore:
+                # Skip if file already exists. Interrupted downloads only ever
+                # leave a .part file behind, so an existing file is complete.
+                if filepath.exists():
+                    self.logger.info(f"File already exists: {filename}")
+                    return filepath
+                
+                part_path = _partial_download_path(filepath)
+                try:
+                    self.logger.info(f"Downloading: {filename}")
+                    # Retry transient failures with the same policy as the
+                    # requests session
+                    for attempt in range(MAX_RETRIES + 1):
+                        try:
+                            size = await self._fetch_pdf_async(session, url, filename, part_path)
+                            break
+                        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                            if attempt == MAX_RETRIES or not _is_retryable(e):
+                                raise
+                            delay = RETRY_BACKOFF_FACTOR * 2 ** attempt
+                            self.logger.warning(f"Retrying {filename} in {delay:.1f}s after error: {e}")
+                            await asyncio.sleep(delay)
+                    os.replace(part_path, filepath)
+                finally:
+                    part_path.unlink(missing_ok=True)
+            
+            self.logger.info(f"Downloaded: {filename} ({size} bytes)")
+            return filepath
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.error(f"Error downloading {filename}: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Unexpected error downloading {filename}: {e}")
+            return None
+    
+    async def _fetch_pdf_async(self, session, url: str, filename: str, part_path: Path) -> int:
+        """
+        GET a PDF and write its body to part_path.
+        
+        Returns:
+            Number of bytes written
+        """
+        async with session.get(url) as response:
+            response.raise_for_status()
+            
+            # Check if it's actually a PDF
+            content_type = response.headers.get('content-type', '').lower()
+            if 'pdf' not in content_type and not _PDF_URL_RE.search(url):
+                self.logger.warning(f"File might not be a PDF: {filename}")
+            
+            with open(part_path, 'wb') as f:
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                return f.tell()
+    
+    async def _probe_pdf_async(self, session, pdf_info: Dict[str, str],
+                               semaphore: asyncio.Semaphore) -> Optional[int]:
+        """
+        Check a PDF link with a HEAD request before downloading it.
+        
+        Args:
+            session: aiohttp.ClientSession shared by all requests
+            pdf_info: Dictionary containing PDF URL, college name, and filename
+            semaphore: Limits the number of requests in flight
+            
+        Returns:
+            Content length in bytes (0 if unknown), or None if the link is broken
+            or serves an HTML page instead of a PDF
+        """
+        url = pdf_info['url']
+        filename = pdf_info['filename']
+        
+        # Files already on disk are returned by the download step as they are
+        if (self.download_dir / filename).exists():
+            return 0
+        
+        try:
+            async with semaphore:
+                async with session.head(url, allow_redirects=True) as response:
+                    # Some servers don't implement HEAD, and transient errors are
+                    # retried by the download; leave those to the GET
+                    if response.status in (405, 501) or response.status in RETRY_STATUSES:
+                        return 0
+                    if response.status >= 400:
+                        self.logger.error(f"Error downloading {filename}: HTTP {response.status} for {url}")
+                        return None
+                    
+                    content_type = response.headers.get('content-type', '').lower()
+                    if 'text/html' in content_type:
+                        self.logger.error(f"Error downloading {filename}: {url} is an HTML page, not a PDF")
+                        return None
+                    
+                    return response.content_length or 0
+                    
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # Let the download itself report the failure
+            return 0
+    
+    async def _download_links_async(self, pdf_links: List[Dict[str, str]], download) -> list:
+        """
+        Run a download coroutine concurrently for each file, at most
+        max_concurrent_downloads at a time.
+        
+        Links are checked with HEAD requests first, so broken links and HTML
+        pages are skipped without transferring a body, and the largest files are
+        started first so they don't end up running alone at the end.
+        
+        Args:
+            pdf_links: List of PDF info dictionaries from get_pdf_links
+            download: Coroutine function called as download(session, pdf_info, semaphore)
+            
+        Returns:
+            The result of each download (None for skipped links), in the same order as pdf_links
+        """
+        # Links that map to the same file share one download, so two
+        # concurrent writers never open the same path
+        unique_links = {}
+        for pdf_info in pdf_links:
+            unique_links.setdefault(pdf_info['filename'], pdf_info)
+        
+        # Like the requests timeout, limit each connect and socket read rather
+        # than the whole transfer, so large PDFs on slow links still complete
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=60)
+        async with aiohttp.ClientSession(headers=dict(self.session.headers), timeout=timeout) as session:
+            probe_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
+            sizes = await asyncio.gather(*(
+                self._probe_pdf_async(session, pdf_info, probe_semaphore)
+                for pdf_info in unique_links.values()
+            ))
+            
+            to_download = sorted(
+                ((size, pdf_info) for size, pdf_info in zip(sizes, unique_links.values()) if size is not None),
+                key=lambda item: item[0],
+                reverse=True
+            )
+            
+            semaphore = asyncio.Semaphore(self.max_concurrent_downloads)
+            downloads = {
+                pdf_info['filename']: asyncio.ensure_future(download(session, pdf_info, semaphore))
+                for _, pdf_info in to_download
+            }
+            if downloads:
+                await asyncio.wait(downloads.values())
+            
+            return [
+                downloads[pdf_info['filename']].result() if pdf_info['filename'] in downloads else None
+                for pdf_info in pdf_links
+            ]
+    
+    async def download_all_async(self, pdf_links: List[Dict[str, str]]) -> List[Optional[Path]]:
+        """
+        Download PDFs concurrently, at most max_concurrent_downloads at a time.
+        
+        Args:
+            pdf_links: List of PDF info dictionaries from get_pdf_links
+            
+        Returns:
+            Downloaded file paths (None for failures), in the same order as pdf_links
+        """
+        return await self._download_links_async(pdf_links, self._download_pdf_async)
+    
+    async def download_and_extract_all_async(self, pdf_links: List[Dict[str, str]]) -> list:
+        """
+        Download PDFs concurrently and extract each one as soon as it arrives.
+        
+        Extraction runs in worker processes while the remaining downloads are
+        still in flight, so the network and CPU work overlap.
+        
+        Args:
+            pdf_links: List of PDF info dictionaries from get_pdf_links
+            
+        Returns:
+            (path, extracted data) for each downloaded PDF, or None for failed
+            downloads, in the same order as pdf_links
+        """
+        loop = asyncio.get_running_loop()
+        
+        # Workers start while aiohttp's resolver threads are running, where
+        # forking is unsafe, so use fresh interpreters instead
+        with ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            async def download_and_extract(session, pdf_info, semaphore):
+                pdf_path = await self._download_pdf_async(session, pdf_info, semaphore)
+                if pdf_path is None:
+                    return None
+                try:
+                    pdf_content = await loop.run_in_executor(executor, _read_pdf, pdf_path)
+                    return pdf_path, self._complete_extraction(pdf_content)
+                except Exception as e:
+                    self.logger.error(f"Error extracting text from {pdf_path}: {e}")
+                    return pdf_path, _failed_extraction(pdf_path, e)
+            
+            return await self._download_links_async(pdf_links, download_and_extract)
+    
+    def download_all(self, pdf_links: List[Dict[str, str]]) -> List[Optional[Path]]:
+        """
+        Download all PDFs, concurrently when aiohttp is installed.
+        
+        Args:
+            pdf_links: List of PDF info dictionaries from get_pdf_links
+            
+        Returns:
+            Downloaded file paths (None for failures), in the same order as pdf_links
+        """
+        if AIOHTTP_AVAILABLE:
+            return asyncio.run(self.download_all_async(pdf_links))
+        
+        pdf_paths = []
+        next_request = 0.0
+        for pdf_info in pdf_links:
+            # Start requests at least a second apart to be respectful to the
+            # server; time spent downloading counts towards the gap
+            delay = next_request - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            next_request = time.monotonic() + 1
+            pdf_paths.append(self.download_pdf(pdf_info))
+        return pdf_paths
+    
     def extract_text_from_pdf(self, pdf_path: Path) -> Dict[str, any]:
         """
         Extract text and metadata from a PDF file.
@@ -238,72 +742,45 @@ class NIRFPDFScraper:
             Dictionary containing extracted text and metadata
         """
         try:
-            self.logger.info(f"Extracting text from: {pdf_path.name}")
-            
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = pypdf.PdfReader(file)
-                
-                # Extract metadata
-                metadata = {
-                    'filename': pdf_path.name,
-                    'num_pages': len(pdf_reader.pages),
-                    'file_size': pdf_path.stat().st_size,
-                    'extracted_at': time.strftime('%Y-%m-%d %H:%M:%S')
-                }
-                
-                # Try to get PDF metadata
-                if pdf_reader.metadata:
-                    metadata.update({
-                        'title': str(pdf_reader.metadata.get('/Title', '')),
-                        'author': str(pdf_reader.metadata.get('/Author', '')),
-                        'subject': str(pdf_reader.metadata.get('/Subject', '')),
-                        'creator': str(pdf_reader.metadata.get('/Creator', ''))
-                    })
-                
-                # Extract text from all pages
-                full_text = ""
-                page_texts = []
-                
-                for page_num, page in enumerate(pdf_reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        page_texts.append({
-                            'page_number': page_num + 1,
-                            'text': page_text,
-                            'char_count': len(page_text)
-                        })
-                        full_text += page_text + "\n"
-                    except Exception as e:
-                        self.logger.warning(f"Error extracting text from page {page_num + 1}: {e}")
-                        page_texts.append({
-                            'page_number': page_num + 1,
-                            'text': '',
-                            'char_count': 0,
-                            'error': str(e)
-                        })
-                
-                # Extract structured data (college information)
-                structured_data = self._extract_structured_data(full_text)
-                
-                return {
-                    'metadata': metadata,
-                    'full_text': full_text,
-                    'pages': page_texts,
-                    'structured_data': structured_data,
-                    'word_count': len(full_text.split()),
-                    'char_count': len(full_text)
-                }
-                
+            return self._complete_extraction(_read_pdf(pdf_path))
         except Exception as e:
             self.logger.error(f"Error extracting text from {pdf_path}: {e}")
-            return {
-                'metadata': {'filename': pdf_path.name, 'error': str(e)},
-                'full_text': '',
-                'pages': [],
-                'structured_data': {},
-                'word_count': 0,
-                'char_count': 0
-            }
+            return _failed_extraction(pdf_path, e)
+    
+    def extract_all(self, pdf_paths: List[Path]) -> List[Dict[str, any]]:
+        """
+        Extract text and metadata from several PDF files in parallel.
+        
+        Text extraction is CPU-bound, so the PDFs are read in worker processes.
+        
+        Args:
+            pdf_paths: Paths to the PDF files
+            
+        Returns:
+            Extracted data for each PDF, in the same order as pdf_paths
+        """
+        if len(pdf_paths) < 2:
+            return [self.extract_text_from_pdf(pdf_path) for pdf_path in pdf_paths]
+        
+        results = []
+        max_workers = min(len(pdf_paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_read_pdf, pdf_path) for pdf_path in pdf_paths]
+            for pdf_path, future in zip(pdf_paths, futures):
+                try:
+                    results.append(self._complete_extraction(future.result()))
+                except Exception as e:
+                    self.logger.error(f"Error extracting text from {pdf_path}: {e}")
+                    results.append(_failed_extraction(pdf_path, e))
+        return results
+    
+    def _complete_extraction(self, pdf_content: Dict[str, any]) -> Dict[str, any]:
+        """Add structured data and counts to the text read from a PDF."""
+        full_text = pdf_content['full_text']
+        pdf_content['structured_data'] = self._extract_structured_data(full_text)
+        pdf_content['word_count'] = len(full_text.split())
+        pdf_content['char_count'] = len(full_text)
+        return pdf_content
     
     def _extract_structured_data(self, text: str) -> Dict[str, any]:
         """
@@ -318,83 +795,58 @@ class NIRFPDFScraper:
         structured = {}
         
         # Extract college name
-        college_patterns = [
-            r'College[:\s]+([^\n]+)',
-            r'Institute[:\s]+([^\n]+)',
-            r'University[:\s]+([^\n]+)',
-            r'Name[:\s]+([^\n]+)'
-        ]
-        
-        for pattern in college_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in COLLEGE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 structured['college_name'] = match.group(1).strip()
                 break
         
         # Extract location/address
-        location_patterns = [
-            r'Address[:\s]+([^\n]+)',
-            r'Location[:\s]+([^\n]+)',
-            r'City[:\s]+([^\n]+)',
-            r'State[:\s]+([^\n]+)'
-        ]
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in LOCATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 structured['location'] = match.group(1).strip()
                 break
         
         # Extract ranking information
-        ranking_patterns = [
-            r'Rank[:\s]+(\d+)',
-            r'Position[:\s]+(\d+)',
-            r'#(\d+)'
-        ]
-        
-        for pattern in ranking_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in RANKING_PATTERNS:
+            match = pattern.search(text)
             if match:
                 structured['rank'] = int(match.group(1))
                 break
         
         # Extract scores/ratings
-        score_patterns = [
-            r'Score[:\s]+([\d.]+)',
-            r'Rating[:\s]+([\d.]+)',
-            r'Points[:\s]+([\d.]+)'
-        ]
-        
         scores = []
-        for pattern in score_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            scores.extend([float(score) for score in matches])
+        for pattern in SCORE_PATTERNS:
+            scores.extend([float(score) for score in pattern.findall(text)])
         
         if scores:
             structured['scores'] = scores
             structured['average_score'] = sum(scores) / len(scores)
         
         # Extract other numerical data
-        numbers = re.findall(r'\d+\.?\d*', text)
+        # Limit to first 20; the scan stops as soon as they are found
+        numbers = [float(match.group()) for match in islice(_NUMBER_RE.finditer(text), 20)]
         if numbers:
-            structured['all_numbers'] = [float(num) for num in numbers[:20]]  # Limit to first 20
+            structured['all_numbers'] = numbers
         
         return structured
     
-    def save_extracted_data(self, pdf_info: Dict[str, str], extracted_data: Dict[str, any]) -> None:
+    def save_extracted_data(self, pdf_info: Dict[str, str], extracted_data: Dict[str, any],
+                            processed_at: Optional[str] = None) -> None:
         """
         Save extracted data to JSON file.
         
         Args:
             pdf_info: Original PDF information
             extracted_data: Extracted text and metadata
+            processed_at: Timestamp to record; defaults to the current time
         """
         try:
             # Create filename based on college name or PDF filename
             college_name = extracted_data.get('structured_data', {}).get('college_name', 
                                                                        pdf_info.get('college_name', 'unknown'))
-            safe_name = re.sub(r'[^\w\s-]', '', college_name)
-            safe_name = re.sub(r'\s+', '_', safe_name.strip())
+            safe_name = '_'.join(_strip_unsafe_chars(college_name).split())
             
             json_filename = f"{safe_name}_data.json"
             json_path = self.data_dir / json_filename
@@ -403,11 +855,10 @@ class NIRFPDFScraper:
             combined_data = {
                 'pdf_info': pdf_info,
                 'extracted_data': extracted_data,
-                'processed_at': time.strftime('%Y-%m-%d %H:%M:%S')
+                'processed_at': processed_at or time.strftime('%Y-%m-%d %H:%M:%S')
             }
             
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(combined_data, f, indent=2, ensure_ascii=False)
+            _write_json(json_path, combined_data)
             
             self.logger.info(f"Saved extracted data to: {json_filename}")
             
@@ -440,24 +891,27 @@ class NIRFPDFScraper:
                 self.logger.warning("No PDF links found on the website")
                 return summary
             
-            # Step 2: Download and process each PDF
-            for pdf_info in pdf_links:
+            # Steps 2 and 3: Download the PDFs and extract their data. With
+            # aiohttp each PDF is extracted while the others are downloading.
+            if AIOHTTP_AVAILABLE:
+                results = asyncio.run(self.download_and_extract_all_async(pdf_links))
+            else:
+                pdf_paths = self.download_all(pdf_links)
+                extractions = iter(self.extract_all([pdf_path for pdf_path in pdf_paths if pdf_path]))
+                results = [(pdf_path, next(extractions)) if pdf_path else None for pdf_path in pdf_paths]
+            
+            # Step 4: Save the results for each PDF, stamped with one batch time
+            processed_at = time.strftime('%Y-%m-%d %H:%M:%S')
+            for pdf_info, result in zip(pdf_links, results):
                 try:
-                    # Download PDF
-                    pdf_path = self.download_pdf(pdf_info)
-                    if pdf_path:
+                    if result:
                         summary['pdfs_downloaded'] += 1
-                        
-                        # Extract data from PDF
-                        extracted_data = self.extract_text_from_pdf(pdf_path)
+                        pdf_path, extracted_data = result
                         
                         # Save extracted data
-                        self.save_extracted_data(pdf_info, extracted_data)
+                        self.save_extracted_data(pdf_info, extracted_data, processed_at)
                         summary['pdfs_processed'] += 1
                         summary['successful_files'].append(pdf_info['filename'])
-                        
-                        # Small delay to be respectful to the server
-                        time.sleep(1)
                     else:
                         summary['failed_files'].append(pdf_info['filename'])
                         
@@ -471,8 +925,7 @@ class NIRFPDFScraper:
             
             # Save summary
             summary_path = self.data_dir / 'scraping_summary.json'
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False)
+            _write_json(summary_path, summary)
             
             self.logger.info(f"Scraping completed. Summary saved to: {summary_path}")
             return summary
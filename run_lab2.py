@@ -15,10 +15,189 @@ The script gracefully handles missing API keys and unavailable services.
 """
 
 import os
+import sys
 import json
+import time
+import asyncio
+import hashlib
+import functools
 import traceback
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
+try:
+    from openai import OpenAI, AsyncOpenAI
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+    OpenAI = AsyncOpenAI = None
+
+try:
+    from anthropic import AsyncAnthropic
+    ANTHROPIC_AVAILABLE = True
+except ImportError:
+    ANTHROPIC_AVAILABLE = False
+    AsyncAnthropic = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """API keys read once from the environment; None when unset or a placeholder"""
+    openai_key: Optional[str] = None
+    anthropic_key: Optional[str] = None
+    google_key: Optional[str] = None
+    deepseek_key: Optional[str] = None
+    groq_key: Optional[str] = None
+    
+    @classmethod
+    def from_env(cls):
+        """Read the *_API_KEY variables, ignoring the .env template placeholders"""
+        keys = {}
+        for provider in ('openai', 'anthropic', 'google', 'deepseek', 'groq'):
+            key = os.getenv(f"{provider.upper()}_API_KEY")
+            if key and key != f"your_{provider}_api_key_here":
+                keys[f"{provider}_key"] = key
+        return cls(**keys)
+    
+    def key(self, provider):
+        """Return the API key for a provider, or None"""
+        return getattr(self, f"{provider}_key")
+
+# Default cap on in-flight requests per provider, overridable with e.g.
+# OPENAI_MAX_CONCURRENCY=2 in the environment or .env
+DEFAULT_MAX_CONCURRENCY = 5
+
+_provider_semaphores = {}
+
+def provider_semaphore(provider):
+    """Return the semaphore limiting concurrent requests to one provider"""
+    # Created on first use so the limit is read after load_dotenv
+    if provider not in _provider_semaphores:
+        limit = int(os.getenv(f"{provider.upper()}_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY))
+        _provider_semaphores[provider] = asyncio.Semaphore(limit)
+    return _provider_semaphores[provider]
+
+def json_loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(data):
+    """Serialize data to JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+# Set LLM_CACHE_DIR (e.g. .llm_cache) to replay identical requests from disk
+# while iterating on the script; entries expire after LLM_CACHE_TTL seconds
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+
+def cache_path(model, messages):
+    """Return the cache file for a request, or None when caching is off"""
+    cache_dir = os.getenv('LLM_CACHE_DIR')
+    if not cache_dir:
+        return None
+    payload = json.dumps({"model": model, "messages": messages}, sort_keys=True)
+    return Path(cache_dir) / f"{hashlib.sha256(payload.encode('utf-8')).hexdigest()}.json"
+
+def cache_get(model, messages):
+    """Return the cached response text for a request, if there is a fresh one"""
+    path = cache_path(model, messages)
+    if path is None:
+        return None
+    try:
+        entry = json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    ttl = float(os.getenv('LLM_CACHE_TTL', DEFAULT_CACHE_TTL))
+    if time.time() - entry['created_at'] > ttl:
+        return None
+    return entry['content']
+
+def cache_set(model, messages, content):
+    """Store the response text for a request when caching is on"""
+    path = cache_path(model, messages)
+    if path is None or not content:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename, so a concurrent reader never sees a partial entry
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(json_dumps({"created_at": time.time(), "model": model, "content": content}))
+    os.replace(tmp_path, path)
+
+# Attempts after the first for rate limits (429), 5xx responses, timeouts and
+# connection errors. The SDKs back off exponentially with jitter between
+# attempts and honour Retry-After.
+MAX_RETRIES = 3
+
+# One client per endpoint, so repeated requests reuse its connection pool
+# instead of opening a new TLS connection each time
+@functools.lru_cache(maxsize=None)
+def openai_client(base_url=None, api_key=None):
+    """Return the shared OpenAI client for an endpoint"""
+    if not OPENAI_AVAILABLE:
+        raise ImportError("openai package not installed (pip install openai)")
+    return OpenAI(api_key=api_key, base_url=base_url, max_retries=MAX_RETRIES)
+
+@functools.lru_cache(maxsize=None)
+def async_openai_client(base_url=None, api_key=None):
+    """Return the shared async OpenAI client for an endpoint"""
+    if not OPENAI_AVAILABLE:
+        raise ImportError("openai package not installed (pip install openai)")
+    return AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=MAX_RETRIES)
+
+@functools.lru_cache(maxsize=None)
+def async_anthropic_client():
+    """Return the shared async Anthropic client"""
+    if not ANTHROPIC_AVAILABLE:
+        raise ImportError("anthropic package not installed (pip install anthropic)")
+    return AsyncAnthropic(max_retries=MAX_RETRIES)
+
+# The competing models. Every endpoint except Anthropic speaks the OpenAI
+# chat completions API; requires_key endpoints read <PROVIDER>_API_KEY.
+ENDPOINTS = [
+    {"name": "GPT-4o-mini", "provider": "openai", "label": "OpenAI",
+     "model": "gpt-4o-mini", "requires_key": True},
+    {"name": "Claude-3.5-Sonnet", "provider": "anthropic", "label": "Anthropic",
+     "model": "claude-3-5-sonnet-20241022", "requires_key": True},
+    {"name": "Gemini-2.0-Flash", "provider": "google", "label": "Google Gemini",
+     "model": "gemini-2.0-flash", "requires_key": True,
+     "base_url": "https://generativelanguage.googleapis.com/v1beta/openai/"},
+    {"name": "DeepSeek-Chat", "provider": "deepseek", "label": "DeepSeek",
+     "model": "deepseek-chat", "requires_key": True,
+     "base_url": "https://api.deepseek.com/v1"},
+    {"name": "Llama-3.3-70b (Groq)", "provider": "groq", "label": "Groq",
+     "model": "llama-3.3-70b-versatile", "requires_key": True,
+     "base_url": "https://api.groq.com/openai/v1"},
+    {"name": "Llama-3.2 (Ollama)", "provider": "ollama", "label": "Ollama",
+     "model": "llama3.2", "base_url": "http://localhost:11434/v1", "api_key": "ollama",
+     "hint": " (Is Ollama running with llama3.2 model?)"},
+]
+
+JUDGE_PROMPT = """You are judging a competition between {count} competitors.
+Each model has been given this question:
+
+{question}
+
+Your job is to evaluate each response for clarity and strength of argument, and rank them in order of best to worst.
+Respond with JSON, and only JSON, with the following format:
+{{"results": ["best competitor number", "second best competitor number", "third best competitor number", ...]}}
+
+Here are the responses from each competitor:
+
+{together}
+
+Now respond with the JSON with the ranked order of the competitors, nothing else. Do not include markdown formatting or code blocks."""
+
 def print_section(title):
     """Print a formatted section header"""
     print("\n" + "="*60)
@@ -29,66 +208,42 @@ def print_subsection(title):
     """Print a formatted subsection header"""
     print(f"\n--- {title} ---")
 
-def check_api_keys():
-    """Check which API keys are available"""
-    print_section("CHECKING API KEYS")
-    
-    keys_info = {}
-    
-    openai_key = os.getenv('OPENAI_API_KEY')
-    if openai_key and openai_key != 'your_openai_api_key_here':
-        print(f"✓ OpenAI API Key exists and begins {openai_key[:8]}...")
-        keys_info['openai'] = True
-    else:
-        print("✗ OpenAI API Key not set or using placeholder")
-        keys_info['openai'] = False
-    
-    anthropic_key = os.getenv('ANTHROPIC_API_KEY')
-    if anthropic_key and anthropic_key != 'your_anthropic_api_key_here':
-        print(f"✓ Anthropic API Key exists and begins {anthropic_key[:7]}...")
-        keys_info['anthropic'] = True
-    else:
-        print("✗ Anthropic API Key not set (optional)")
-        keys_info['anthropic'] = False
-    
-    google_key = os.getenv('GOOGLE_API_KEY')
-    if google_key and google_key != 'your_google_api_key_here':
-        print(f"✓ Google API Key exists and begins {google_key[:2]}...")
-        keys_info['google'] = True
-    else:
-        print("✗ Google API Key not set (optional)")
-        keys_info['google'] = False
-    
-    deepseek_key = os.getenv('DEEPSEEK_API_KEY')
-    if deepseek_key and deepseek_key != 'your_deepseek_api_key_here':
-        print(f"✓ DeepSeek API Key exists and begins {deepseek_key[:3]}...")
-        keys_info['deepseek'] = True
-    else:
-        print("✗ DeepSeek API Key not set (optional)")
-        keys_info['deepseek'] = False
+# (label, provider, characters of the key to show, message when missing)
+API_KEY_CHECKS = [
+    ("OpenAI", "openai", 8, "not set or using placeholder"),
+    ("Anthropic", "anthropic", 7, "not set (optional)"),
+    ("Google", "google", 2, "not set (optional)"),
+    ("DeepSeek", "deepseek", 3, "not set (optional)"),
+    ("Groq", "groq", 4, "not set (optional)"),
+]
+
+def check_api_keys(config, verbose=True):
+    """Report which API keys are available"""
+    if not verbose:
+        return
     
-    groq_key = os.getenv('GROQ_API_KEY')
-    if groq_key and groq_key != 'your_groq_api_key_here':
-        print(f"✓ Groq API Key exists and begins {groq_key[:4]}...")
-        keys_info['groq'] = True
-    else:
-        print("✗ Groq API Key not set (optional)")
-        keys_info['groq'] = False
+    print_section("CHECKING API KEYS")
     
-    return keys_info
+    # Build the whole report and write it at once
+    lines = []
+    for label, provider, shown, missing in API_KEY_CHECKS:
+        key = config.key(provider)
+        if key:
+            lines.append(f"✓ {label} API Key exists and begins {key[:shown]}...")
+        else:
+            lines.append(f"✗ {label} API Key {missing}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def generate_question(keys_info):
+def generate_question(config):
     """Generate a challenging question using OpenAI"""
     print_section("GENERATING CHALLENGING QUESTION")
     
-    if not keys_info['openai']:
+    if not config.openai_key:
         print("⚠️  OpenAI API key required for question generation. Using fallback question.")
         return "Imagine you are tasked with explaining the concept of emergence to someone who has never encountered it before. How would you illustrate this concept using three different examples from completely different domains (biological, social, and technological), and what underlying principles connect these seemingly disparate phenomena?"
     
     try:
-        from openai import OpenAI
-        
-        openai_client = OpenAI()
+        client = openai_client()
         
         request = "Please come up with a challenging, nuanced question that I can ask a number of LLMs to evaluate their intelligence. "
         request += "Answer only with the question, no explanation."
@@ -96,11 +251,14 @@ def generate_question(keys_info):
         
         print("🤖 Asking GPT-4o-mini to generate a challenging question...")
         
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=messages,
-        )
-        question = response.choices[0].message.content
+        question = cache_get("gpt-4o-mini", messages)
+        if question is None:
+            response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=messages,
+            )
+            question = response.choices[0].message.content
+            cache_set("gpt-4o-mini", messages, question)
         
         print(f"✓ Generated question: {question}")
         return question
@@ -111,169 +269,74 @@ def generate_question(keys_info):
         print(f"📋 Using fallback question: {fallback}")
         return fallback
 
-def test_openai_model(question, keys_info):
-    """Test OpenAI GPT-4o-mini"""
-    if not keys_info['openai']:
-        return None, "OpenAI API key not available"
-    
-    try:
-        from openai import OpenAI
-        
-        openai_client = OpenAI()
-        messages = [{"role": "user", "content": question}]
-        
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini", 
-            messages=messages
-        )
-        answer = response.choices[0].message.content
-        return answer, None
-        
-    except Exception as e:
-        return None, f"OpenAI error: {str(e)}"
-
-def test_anthropic_model(question, keys_info):
-    """Test Anthropic Claude"""
-    if not keys_info['anthropic']:
-        return None, "Anthropic API key not available"
-    
-    try:
-        from anthropic import Anthropic
-        
-        claude = Anthropic()
-        messages = [{"role": "user", "content": question}]
-        
-        response = claude.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            messages=messages, 
-            max_tokens=1000
-        )
-        answer = response.content[0].text
-        return answer, None
-        
-    except Exception as e:
-        return None, f"Anthropic error: {str(e)}"
-
-def test_google_model(question, keys_info):
-    """Test Google Gemini"""
-    if not keys_info['google']:
-        return None, "Google API key not available"
-    
-    try:
-        from openai import OpenAI
-        
-        google_key = os.getenv('GOOGLE_API_KEY')
-        gemini = OpenAI(api_key=google_key, base_url="https://generativelanguage.googleapis.com/v1beta/openai/")
-        messages = [{"role": "user", "content": question}]
-        
-        response = gemini.chat.completions.create(
-            model="gemini-2.0-flash", 
-            messages=messages
-        )
-        answer = response.choices[0].message.content
-        return answer, None
-        
-    except Exception as e:
-        return None, f"Google Gemini error: {str(e)}"
-
-def test_deepseek_model(question, keys_info):
-    """Test DeepSeek"""
-    if not keys_info['deepseek']:
-        return None, "DeepSeek API key not available"
-    
-    try:
-        from openai import OpenAI
-        
-        deepseek_key = os.getenv('DEEPSEEK_API_KEY')
-        deepseek = OpenAI(api_key=deepseek_key, base_url="https://api.deepseek.com/v1")
-        messages = [{"role": "user", "content": question}]
-        
-        response = deepseek.chat.completions.create(
-            model="deepseek-chat", 
-            messages=messages
-        )
-        answer = response.choices[0].message.content
-        return answer, None
-        
-    except Exception as e:
-        return None, f"DeepSeek error: {str(e)}"
-
-def test_groq_model(question, keys_info):
-    """Test Groq Llama"""
-    if not keys_info['groq']:
-        return None, "Groq API key not available"
+async def ask(endpoint, question, config):
+    """Ask one endpoint the question, returning (answer, error)"""
+    provider = endpoint['provider']
+    if endpoint.get('requires_key') and not config.key(provider):
+        return None, f"{endpoint['label']} API key not available"
     
     try:
-        from openai import OpenAI
-        
-        groq_key = os.getenv('GROQ_API_KEY')
-        groq = OpenAI(api_key=groq_key, base_url="https://api.groq.com/openai/v1")
-        messages = [{"role": "user", "content": question}]
-        
-        response = groq.chat.completions.create(
-            model="llama-3.3-70b-versatile", 
-            messages=messages
-        )
-        answer = response.choices[0].message.content
-        return answer, None
-        
-    except Exception as e:
-        return None, f"Groq error: {str(e)}"
-
-def test_ollama_model(question):
-    """Test local Ollama model"""
-    try:
-        from openai import OpenAI
-        
-        ollama = OpenAI(base_url='http://localhost:11434/v1', api_key='ollama')
+        model = endpoint['model']
         messages = [{"role": "user", "content": question}]
         
-        response = ollama.chat.completions.create(
-            model="llama3.2", 
-            messages=messages
-        )
-        answer = response.choices[0].message.content
+        answer = cache_get(model, messages)
+        if answer is None:
+            async with provider_semaphore(provider):
+                if provider == 'anthropic':
+                    response = await async_anthropic_client().messages.create(
+                        model=model,
+                        messages=messages, 
+                        max_tokens=1000
+                    )
+                    answer = response.content[0].text
+                else:
+                    api_key = config.key(provider) if endpoint.get('requires_key') else endpoint.get('api_key')
+                    client = async_openai_client(base_url=endpoint.get('base_url'), api_key=api_key)
+                    response = await client.chat.completions.create(
+                        model=model, 
+                        messages=messages
+                    )
+                    answer = response.choices[0].message.content
+            cache_set(model, messages, answer)
         return answer, None
         
     except Exception as e:
-        return None, f"Ollama error: {str(e)} (Is Ollama running with llama3.2 model?)"
+        return None, f"{endpoint['label']} error: {str(e)}{endpoint.get('hint', '')}"
 
-def test_all_models(question, keys_info):
-    """Test all available models with the question"""
+async def test_all_models(question, config):
+    """Test all available models with the question, querying them concurrently"""
     print_section("TESTING MODELS")
     
-    models = [
-        ("GPT-4o-mini", lambda: test_openai_model(question, keys_info)),
-        ("Claude-3.5-Sonnet", lambda: test_anthropic_model(question, keys_info)),
-        ("Gemini-2.0-Flash", lambda: test_google_model(question, keys_info)),
-        ("DeepSeek-Chat", lambda: test_deepseek_model(question, keys_info)),
-        ("Llama-3.3-70b (Groq)", lambda: test_groq_model(question, keys_info)),
-        ("Llama-3.2 (Ollama)", lambda: test_ollama_model(question)),
-    ]
+    # The providers are independent, so the total wait is the slowest one
+    # rather than the sum; one failure doesn't cancel the others
+    results = await asyncio.gather(
+        *(ask(endpoint, question, config) for endpoint in ENDPOINTS),
+        return_exceptions=True
+    )
     
     competitors = []
     answers = []
     
-    for model_name, test_func in models:
+    for endpoint, result in zip(ENDPOINTS, results):
+        model_name = endpoint['name']
         print_subsection(f"Testing {model_name}")
         
-        try:
-            answer, error = test_func()
-            
-            if answer:
-                print(f"✓ {model_name} responded successfully")
-                print(f"📝 Response preview: {answer[:100]}...")
-                competitors.append(model_name)
-                answers.append(answer)
-            else:
-                print(f"✗ {model_name} failed: {error}")
-                
-        except Exception as e:
-            print(f"✗ {model_name} error: {str(e)}")
+        if isinstance(result, Exception):
+            print(f"✗ {model_name} error: {str(result)}")
+            continue
+        
+        answer, error = result
+        if answer:
+            print(f"✓ {model_name} responded successfully")
+            print(f"📝 Response preview: {answer[:100]}...")
+            competitors.append(model_name)
+            answers.append(answer)
+        else:
+            print(f"✗ {model_name} failed: {error}")
     
     return competitors, answers
 
-def judge_responses(question, competitors, answers, keys_info):
+def judge_responses(question, competitors, answers, config):
     """Use a model to judge and rank the responses"""
     print_section("JUDGING RESPONSES")
     
@@ -281,49 +344,37 @@ def judge_responses(question, competitors, answers, keys_info):
         print("⚠️  Need at least 2 model responses to judge. Skipping judgment.")
         return None
     
-    if not keys_info['openai']:
+    if not config.openai_key:
         print("⚠️  OpenAI API key required for judging. Skipping judgment.")
         return None
     
     # Prepare the responses for judging
-    together = ""
-    for index, answer in enumerate(answers):
-        together += f"# Response from competitor {index+1}\n\n"
-        together += answer + "\n\n"
+    together = "".join(
+        f"# Response from competitor {index+1}\n\n{answer}\n\n"
+        for index, answer in enumerate(answers)
+    )
     
-    judge_prompt = f"""You are judging a competition between {len(competitors)} competitors.
-Each model has been given this question:
-
-{question}
-
-Your job is to evaluate each response for clarity and strength of argument, and rank them in order of best to worst.
-Respond with JSON, and only JSON, with the following format:
-{{"results": ["best competitor number", "second best competitor number", "third best competitor number", ...]}}
-
-Here are the responses from each competitor:
-
-{together}
-
-Now respond with the JSON with the ranked order of the competitors, nothing else. Do not include markdown formatting or code blocks."""
+    judge_prompt = JUDGE_PROMPT.format(count=len(competitors), question=question, together=together)
     
     try:
-        from openai import OpenAI
-        
-        openai_client = OpenAI()
+        client = openai_client()
         judge_messages = [{"role": "user", "content": judge_prompt}]
         
         print("⚖️  Asking o3-mini to judge the responses...")
         
-        response = openai_client.chat.completions.create(
-            model="o3-mini",
-            messages=judge_messages,
-        )
-        results = response.choices[0].message.content
+        results = cache_get("o3-mini", judge_messages)
+        if results is None:
+            response = client.chat.completions.create(
+                model="o3-mini",
+                messages=judge_messages,
+            )
+            results = response.choices[0].message.content
+            cache_set("o3-mini", judge_messages, results)
         
         print(f"📊 Raw judgment result: {results}")
         
         # Parse the JSON response
-        results_dict = json.loads(results)
+        results_dict = json_loads(results)
         ranks = results_dict["results"]
         
         print_subsection("FINAL RANKINGS")
@@ -370,17 +421,18 @@ def main():
     print("This script implements the complete Lab2 workflow from 1_foundations/2_lab2.ipynb")
     print("Demonstrating the Multi-Model Comparison pattern with multiple AI providers")
     
-    # Load environment variables
+    # Load environment variables and read the API keys once
     load_dotenv(override=True)
+    config = Config.from_env()
     
     # Check available API keys
-    keys_info = check_api_keys()
+    check_api_keys(config)
     
     # Generate the challenging question
-    question = generate_question(keys_info)
+    question = generate_question(config)
     
     # Test all available models
-    competitors, answers = test_all_models(question, keys_info)
+    competitors, answers = asyncio.run(test_all_models(question, config))
     
     if not competitors:
         print("\n❌ No models were able to respond. Please check your API keys and try again.")
@@ -390,7 +442,7 @@ def main():
         return
     
     # Judge the responses if we have multiple
-    rankings = judge_responses(question, competitors, answers, keys_info)
+    rankings = judge_responses(question, competitors, answers, config)
     
     # Display complete results
     display_full_results(question, competitors, answers, rankings)
@@ -6,9 +6,15 @@ This script tests the basic functionality of the scraper with a mock/test setup.
 """
 
 import os
+import re
 import sys
-import json
+import copy
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import Mock, patch
 import requests
@@ -17,7 +23,11 @@ import requests
 sys.path.insert(0, '.')
 
 try:
-    from nirf_pdf_scraper import NIRFPDFScraper
+    import pypdf
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+    from nirf_pdf_scraper import (
+        DOWNLOAD_CHUNK_SIZE, NIRFPDFScraper, _PDF_URL_RE, _read_pdf, _strip_unsafe_chars, _write_json
+    )
     print("✓ Successfully imported NIRF PDF Scraper")
 except ImportError as e:
     print(f"Error importing scraper: {e}")
@@ -33,9 +43,8 @@ except ImportError as e:
     ANALYZER_AVAILABLE = False
 
 
-def create_test_html():
-    """Create a mock HTML page with PDF links for testing."""
-    return """
+# The mock ranking page, encoded once for the mocked response bodies
+TEST_HTML = """
     <!DOCTYPE html>
     <html>
     <head><title>Test Rankings</title></head>
@@ -61,6 +70,12 @@ def create_test_html():
     </body>
     </html>
     """
+TEST_HTML_BYTES = TEST_HTML.encode('utf-8')
+
+
+def create_test_html():
+    """Create a mock HTML page with PDF links for testing."""
+    return TEST_HTML
 
 
 def create_test_pdf_content():
@@ -69,6 +84,51 @@ def create_test_pdf_content():
     return b"Mock PDF content for testing"
 
 
+def create_test_pdf(path, page_texts):
+    """Write a real PDF with one line of text per page."""
+    writer = pypdf.PdfWriter()
+    font = writer._add_object(DictionaryObject({
+        NameObject('/Type'): NameObject('/Font'),
+        NameObject('/Subtype'): NameObject('/Type1'),
+        NameObject('/BaseFont'): NameObject('/Helvetica')
+    }))
+    
+    for text in page_texts:
+        page = writer.add_blank_page(612, 792)
+        content = DecodedStreamObject()
+        content.set_data(f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode('latin-1'))
+        page[NameObject('/Contents')] = writer._add_object(content)
+        page[NameObject('/Resources')] = DictionaryObject({
+            NameObject('/Font'): DictionaryObject({NameObject('/F1'): font})
+        })
+    
+    writer.write(path)
+
+
+@contextmanager
+def serve_directory(directory):
+    """Serve a directory over HTTP on localhost, recording the GET request paths."""
+    requests_seen = []
+    
+    class Handler(SimpleHTTPRequestHandler):
+        def do_GET(self):
+            requests_seen.append(self.path)
+            super().do_GET()
+        
+        def log_message(self, format, *args):
+            pass
+    
+    server = ThreadingHTTPServer(('127.0.0.1', 0), partial(Handler, directory=directory))
+    # Poll often, so shutdown() doesn't wait out the default half second
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", requests_seen
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 def test_scraper_basic_functionality():
     """Test basic functionality of the scraper."""
     print("Testing NIRF PDF Scraper...")
@@ -105,11 +165,45 @@ def test_scraper_basic_functionality():
         # Test filename generation
         test_filename = scraper._generate_filename("Test College", "original.pdf")
         assert test_filename.endswith(".pdf"), "Generated filename should end with .pdf"
+        assert scraper._generate_filename("", "files/report.pdf?x=1&y=2") == "report.pdf", \
+            "Fallback filename should drop the query string"
         print("✓ Filename generation works")
         
+        # Test PDF link matching
+        for url in ["report.pdf", "REPORT.PDF", "file.pdf#page=2", "file.pdf?x=1&y=2"]:
+            assert _PDF_URL_RE.search(url), f"{url} should be a PDF link"
+        for url in ["report.html", "report.pdf.html", "pdfs/index", "report.pdfx"]:
+            assert not _PDF_URL_RE.search(url), f"{url} should not be a PDF link"
+        print("✓ PDF link matching works")
+        
     print("Basic functionality tests passed!")
 
 
+def test_session_adapter():
+    """Test that the session pools connections and retries transient errors."""
+    print("\nTesting session adapter...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        scraper = NIRFPDFScraper(
+            download_dir=os.path.join(temp_dir, "pdfs"),
+            data_dir=os.path.join(temp_dir, "data")
+        )
+        
+        adapter = scraper.session.get_adapter("https://www.nirfindia.org/")
+        assert scraper.session.get_adapter("http://www.nirfindia.org/") is adapter, \
+            "HTTP and HTTPS should share one adapter"
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] == 16, \
+            "Adapter should keep up to 16 connections per host"
+        print("✓ Connections are pooled")
+        
+        retry = adapter.max_retries
+        assert retry.total == 3, "Should retry up to 3 times"
+        assert set(retry.status_forcelist) == {502, 503, 504}, "Should retry gateway errors"
+        print("✓ Transient errors are retried")
+    
+    print("Session adapter tests passed!")
+
+
 def test_html_parsing():
     """Test HTML parsing functionality."""
     print("\nTesting HTML parsing...")
@@ -122,7 +216,7 @@ def test_html_parsing():
         
         # Mock the requests.get method
         mock_response = Mock()
-        mock_response.content = create_test_html().encode('utf-8')
+        mock_response.content = TEST_HTML_BYTES
         mock_response.raise_for_status = Mock()
         
         with patch.object(scraper.session, 'get', return_value=mock_response):
@@ -142,6 +236,130 @@ def test_html_parsing():
     print("HTML parsing tests passed!")
 
 
+def test_download_from_local_server():
+    """Test the full scrape against a local HTTP server."""
+    print("\nTesting downloads from a local server...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        site_dir = os.path.join(temp_dir, "site")
+        os.makedirs(site_dir)
+        create_test_pdf(os.path.join(site_dir, "alpha.pdf"), ["Rank: 7"])
+        create_test_pdf(os.path.join(site_dir, "alpha_copy.pdf"), ["Rank: 7"])
+        
+        # Alpha is listed twice under different URLs, which map to the same
+        # filename; beta's PDF does not exist on the server
+        with open(os.path.join(site_dir, "index.html"), 'w') as f:
+            f.write("""
+            <table>
+                <tr><td>1</td><td><a href="alpha.pdf">Alpha Institute</a></td></tr>
+                <tr><td>1</td><td><a href="alpha_copy.pdf">Alpha Institute</a></td></tr>
+                <tr><td>2</td><td><a href="beta.pdf">Beta Institute</a></td></tr>
+            </table>
+            """)
+        
+        with serve_directory(site_dir) as (base_url, requests_seen):
+            scraper = NIRFPDFScraper(
+                base_url=f"{base_url}/index.html",
+                download_dir=os.path.join(temp_dir, "pdfs"),
+                data_dir=os.path.join(temp_dir, "data")
+            )
+            summary = scraper.scrape_and_download_all()
+        
+        assert summary['pdf_links_found'] == 3, "Should find all three PDF links"
+        assert summary['failed_files'] == ["Beta_Institute.pdf"], "Missing PDF should be a failed file"
+        assert summary['successful_files'] == ["Alpha_Institute.pdf", "Alpha_Institute.pdf"], \
+            "Both Alpha links should resolve to the downloaded file"
+        print("✓ 404 link is reported as a failed file")
+        
+        pdf_gets = [path for path in requests_seen if path.startswith("/alpha")]
+        assert len(pdf_gets) == 1, "Duplicate filename should be downloaded once"
+        assert not list(scraper.download_dir.glob("*.part")), "No partial downloads should remain"
+        print("✓ Duplicate filename is downloaded once")
+    
+    print("Local server download tests passed!")
+
+
+def test_sync_download():
+    """Test the streaming requests download used when aiohttp is not installed."""
+    print("\nTesting synchronous downloads...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        site_dir = os.path.join(temp_dir, "site")
+        os.makedirs(site_dir)
+        # Several download blocks' worth, so the body arrives in chunks
+        body = os.urandom(3 * DOWNLOAD_CHUNK_SIZE + 123)
+        with open(os.path.join(site_dir, "large.pdf"), 'wb') as f:
+            f.write(body)
+        
+        with serve_directory(site_dir) as (base_url, requests_seen):
+            scraper = NIRFPDFScraper(
+                download_dir=os.path.join(temp_dir, "pdfs"),
+                data_dir=os.path.join(temp_dir, "data")
+            )
+            pdf_info = {'url': f"{base_url}/large.pdf", 'college_name': 'Large', 'filename': 'large.pdf'}
+            
+            pdf_path = scraper.download_pdf(pdf_info)
+            assert pdf_path is not None and pdf_path.read_bytes() == body, \
+                "Downloaded file should match the served body"
+            print("✓ Streamed download matches the source")
+            
+            assert scraper.download_pdf(pdf_info) == pdf_path, "Existing file should be returned"
+            assert requests_seen == ["/large.pdf"], "Existing file should not be fetched again"
+            print("✓ Existing file is not downloaded again")
+            
+            missing = {'url': f"{base_url}/missing.pdf", 'college_name': 'Missing', 'filename': 'missing.pdf'}
+            assert scraper.download_pdf(missing) is None, "404 should fail the download"
+            assert not list(scraper.download_dir.glob("missing.pdf*")), "Failed download should leave no file"
+            print("✓ Failed download leaves no file behind")
+    
+    print("Synchronous download tests passed!")
+
+
+def test_page_offsets():
+    """Test that page offsets slice each page's text out of full_text."""
+    print("\nTesting page offsets...")
+    
+    page_texts = ["Rank: 12", "Score: 88.5", "", "Last page"]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_path = Path(temp_dir) / "pages.pdf"
+        create_test_pdf(pdf_path, page_texts)
+        
+        pdf_content = _read_pdf(pdf_path)
+        full_text = pdf_content['full_text']
+        
+        assert len(pdf_content['pages']) == len(page_texts), "Should record every page"
+        for page, expected in zip(pdf_content['pages'], page_texts):
+            start = page['char_start']
+            assert full_text[start:start + page['char_count']].strip() == expected, \
+                f"Page {page['page_number']} offsets should slice out its text"
+        print(f"✓ Offsets match all {len(page_texts)} pages")
+    
+    print("Page offset tests passed!")
+
+
+def test_unsafe_char_stripping():
+    """Test that the sanitizer matches the regex it replaces, including non-ASCII."""
+    print("\nTesting unsafe character stripping...")
+    
+    samples = [
+        "Indian Institute of Technology (IIT), Delhi",
+        "Test@#$%College Name",
+        "Université de Montréal – Faculté",
+        "भारतीय प्रौद्योगिकी संस्थान, मद्रास",
+        "Ｆｕｌｌｗｉｄｔｈ Ｃｏｌｌｅｇｅ №1 ™",
+        "tab\tand\nnewline_under-score",
+        "",
+    ]
+    
+    for sample in samples:
+        assert _strip_unsafe_chars(sample) == re.sub(r'[^\w\s-]', '', sample), \
+            f"Sanitizer should match the regex for {sample!r}"
+    print(f"✓ Sanitizer matches the regex on {len(samples)} samples")
+    
+    print("Unsafe character stripping tests passed!")
+
+
 def test_text_extraction():
     """Test text extraction functionality."""
     print("\nTesting text extraction...")
@@ -218,14 +436,17 @@ def test_data_analyzer():
             "processed_at": "2025-01-01 12:00:00"
         }
         
-        # Save sample data
-        for i in range(3):
-            data_copy = sample_data.copy()
+        # Save sample data. Each file gets a deep copy, since the nested
+        # dicts are modified and the files are written in parallel.
+        def write_sample(i):
+            data_copy = copy.deepcopy(sample_data)
             data_copy['pdf_info']['college_name'] = f"Test College {i+1}"
             data_copy['extracted_data']['structured_data']['rank'] = 50 + i
             
-            with open(os.path.join(data_dir, f"test_college_{i+1}_data.json"), 'w') as f:
-                json.dump(data_copy, f)
+            _write_json(Path(data_dir) / f"test_college_{i+1}_data.json", data_copy)
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(write_sample, range(3)))
         
         # Test analyzer
         analyzer = NIRFDataAnalyzer(data_dir)
@@ -234,6 +455,7 @@ def test_data_analyzer():
         
         if ANALYZER_AVAILABLE and analyzer.df is not None:
             assert len(analyzer.df) == 3, "DataFrame should have 3 rows"
+            assert sorted(analyzer.df['rank']) == [50, 51, 52], "Each file should keep its own rank"
             print(f"✓ Created DataFrame with {len(analyzer.df)} rows")
         else:
             print("✓ Skipped DataFrame creation (pandas not available)")
@@ -312,7 +534,12 @@ def main():
     
     try:
         test_scraper_basic_functionality()
+        test_session_adapter()
         test_html_parsing()
+        test_download_from_local_server()
+        test_sync_download()
+        test_page_offsets()
+        test_unsafe_char_stripping()
         test_text_extraction()
         test_data_analyzer()
         test_integration()